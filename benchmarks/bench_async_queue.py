@@ -0,0 +1,63 @@
+# Compares AsyncQueue against asyncio.Queue on a bounded queue.
+# fan-in  - many producers feed a single consumer
+# fan-out - a single producer feeds many consumers
+#
+# Usage: python benchmarks/bench_async_queue.py --items 200000 --tasks 1 10 100 --max-size 64
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Async_queues import AsyncQueue
+
+
+async def produce(put, count):
+  for i in range(count):
+    await put(i)
+
+
+async def consume(get, count):
+  for _ in range(count):
+    await get()
+
+
+def split(total, parts):
+  return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+async def run(factory, put_name, get_name, items, producers, consumers):
+  structure = factory()
+  put = getattr(structure, put_name)
+  get = getattr(structure, get_name)
+  start = time.perf_counter()
+  await asyncio.gather(
+    *[produce(put, count) for count in split(items, producers)],
+    *[consume(get, count) for count in split(items, consumers)],
+  )
+  return time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="AsyncQueue vs asyncio.Queue")
+  parser.add_argument("--items", type=int, default=200000)
+  parser.add_argument("--tasks", type=int, nargs="+", default=[1, 10, 100])
+  parser.add_argument("--max-size", type=int, default=64)
+  args = parser.parse_args()
+  queues = [
+    ("AsyncQueue", lambda: AsyncQueue(args.max_size), "enqueue", "dequeue"),
+    ("asyncio.Queue", lambda: asyncio.Queue(args.max_size), "put", "get"),
+  ]
+  print("{:<16}{:<9}{:>7}{:>12}{:>16}".format("queue", "load", "tasks", "seconds", "items/s"))
+  for tasks in args.tasks:
+    for load, producers, consumers in (("fan-in", tasks, 1), ("fan-out", 1, tasks)):
+      for name, factory, put_name, get_name in queues:
+        elapsed = asyncio.run(run(factory, put_name, get_name, args.items, producers, consumers))
+        print("{:<16}{:<9}{:>7}{:>12.3f}{:>16,.0f}".format(name, load, tasks, elapsed, args.items / elapsed))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,67 @@
+# Compares one-at-a-time enqueue/dequeue and push/pop against the batch methods.
+# For every batch size the same number of items is moved through each structure and the time per item is reported.
+#
+# Usage: python benchmarks/bench_batch_operations.py --items 1000000 --batch 1000 10000
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Ring_buffer_queues import RingBufferQueue
+from linear_data_structures.Stacks import Stack
+
+
+def one_at_a_time(add, remove, items, batch):
+  batch_values = range(batch)
+  start = time.perf_counter()
+  for _ in range(items // batch):
+    for value in batch_values:
+      add(value)
+    for _ in batch_values:
+      remove()
+  return time.perf_counter() - start
+
+
+def batched(add_many, remove_many, items, batch):
+  batch_values = range(batch)
+  start = time.perf_counter()
+  for _ in range(items // batch):
+    add_many(batch_values)
+    remove_many(batch)
+  return time.perf_counter() - start
+
+
+def run(items, batch):
+  results = []
+  structures = [
+    ("Queue", lambda: Queue(max_size=batch), "enqueue", "dequeue"),
+    ("RingBufferQueue", lambda: RingBufferQueue(max_size=batch), "enqueue", "dequeue"),
+    ("Stack", lambda: Stack(limit=batch), "push", "pop"),
+  ]
+  for name, factory, add, remove in structures:
+    structure = factory()
+    single = one_at_a_time(getattr(structure, add), getattr(structure, remove), items, batch)
+    structure = factory()
+    many = batched(getattr(structure, add + "_many"), getattr(structure, remove + "_many"), items, batch)
+    results.append((name, single, many))
+  return results
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Single-item vs batch operations")
+  parser.add_argument("--items", type=int, default=10 ** 6)
+  parser.add_argument("--batch", type=int, nargs="+", default=[1000, 10000])
+  args = parser.parse_args()
+  print("{:<18}{:>8}{:>16}{:>16}{:>10}".format("structure", "batch", "single ns/item", "batch ns/item", "speedup"))
+  for batch in args.batch:
+    for name, single, many in run(args.items, batch):
+      print("{:<18}{:>8}{:>16.1f}{:>16.1f}{:>9.1f}x".format(
+        name, batch, single / args.items * 1e9, many / args.items * 1e9, single / many))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,95 @@
+# Compares the caches in Caches.py with an OrderedDict LRU and functools.lru_cache on a skewed key stream.
+# Keys follow a skewed (log-uniform) distribution so a small set of keys is requested far more often than the rest, as in most real lookups.
+# cache-aside - get(key), and put(key, value) on a miss
+# memoize     - calling a memoized function, compared with the same function wrapped by functools.lru_cache
+#
+# Usage: python benchmarks/bench_caches.py --requests 1000000 --keys 100000 --max-size 1000 10000
+
+import argparse
+import functools
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Caches import LRUCache, LFUCache, SegmentedLRUCache, memoize, MISSING
+
+
+class OrderedDictLRU:
+  def __init__(self, max_size):
+    self.max_size = max_size
+    self.entries = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, key, default=None):
+    try:
+      value = self.entries[key]
+    except KeyError:
+      self.misses += 1
+      return default
+    self.entries.move_to_end(key)
+    self.hits += 1
+    return value
+
+  def put(self, key, value):
+    self.entries[key] = value
+    self.entries.move_to_end(key)
+    if len(self.entries) > self.max_size:
+      self.entries.popitem(last=False)
+
+
+def key_stream(requests, keys, seed=7):
+  generator = random.Random(seed)
+  return [int(keys ** generator.random()) - 1 for _ in range(requests)]
+
+
+def cache_aside(cache, stream):
+  get = cache.get
+  put = cache.put
+  start = time.perf_counter()
+  for key in stream:
+    if get(key, MISSING) is MISSING:
+      put(key, key)
+  elapsed = time.perf_counter() - start
+  return elapsed, cache.hits / len(stream)
+
+
+def memoized(wrap, stream):
+  function = wrap(lambda key: key)
+  start = time.perf_counter()
+  for key in stream:
+    function(key)
+  return time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Caches vs OrderedDict and functools.lru_cache")
+  parser.add_argument("--requests", type=int, default=10 ** 6)
+  parser.add_argument("--keys", type=int, default=10 ** 5)
+  parser.add_argument("--max-size", type=int, nargs="+", default=[1000, 10000])
+  args = parser.parse_args()
+  stream = key_stream(args.requests, args.keys)
+  print("{:<22}{:>10}{:>12}{:>16}{:>10}".format("cache", "max_size", "seconds", "requests/s", "hit rate"))
+  for max_size in args.max_size:
+    for name, cache in (
+      ("LRUCache", LRUCache(max_size)),
+      ("LFUCache", LFUCache(max_size)),
+      ("SegmentedLRUCache", SegmentedLRUCache(max_size)),
+      ("OrderedDict LRU", OrderedDictLRU(max_size)),
+    ):
+      elapsed, hit_rate = cache_aside(cache, stream)
+      print("{:<22}{:>10}{:>12.3f}{:>16,.0f}{:>10.3f}".format(name, max_size, elapsed, len(stream) / elapsed, hit_rate))
+    for name, wrap in (
+      ("memoize(LRUCache)", memoize(max_size=max_size)),
+      ("functools.lru_cache", functools.lru_cache(maxsize=max_size)),
+    ):
+      elapsed = memoized(wrap, stream)
+      print("{:<22}{:>10}{:>12.3f}{:>16,.0f}{:>10}".format(name, max_size, elapsed, len(stream) / elapsed, ""))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,93 @@
+# Measures producer/consumer throughput as the number of threads grows.
+# Half of the threads produce and half consume (at least one of each), and all of them share one structure with a bounded size so producers feel backpressure.
+# Compared structures:
+# GlobalLockQueue - the linked Queue wrapped in one lock, which is what callers did before ConcurrentQueue existed
+# ConcurrentQueue - separate head and tail locks
+# ConcurrentStack - one lock shared by two conditions
+# queue.Queue     - the standard library queue, for reference
+#
+# Usage: python benchmarks/bench_concurrency.py --items 200000 --threads 1 2 4 8 16 32
+
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Concurrent_structures import ConcurrentQueue, ConcurrentStack
+
+
+class GlobalLockQueue:
+  def __init__(self, max_size):
+    self.queue = Queue(max_size)
+    self.lock = threading.Lock()
+    self.not_empty = threading.Condition(self.lock)
+    self.not_full = threading.Condition(self.lock)
+
+  def put(self, value):
+    with self.lock:
+      self.not_full.wait_for(self.queue.has_space)
+      self.queue.enqueue(value)
+      self.not_empty.notify()
+
+  def get(self):
+    with self.lock:
+      self.not_empty.wait_for(lambda: not self.queue.is_empty())
+      value = self.queue.dequeue()
+      self.not_full.notify()
+      return value
+
+
+def run(factory, items, threads):
+  producers = max(1, threads // 2)
+  consumers = max(1, threads - producers)
+  structure = factory()
+  per_producer = items // producers
+  total = per_producer * producers
+  per_consumer = [total // consumers + (1 if i < total % consumers else 0) for i in range(consumers)]
+
+  def produce():
+    put = structure.put
+    for i in range(per_producer):
+      put(i)
+
+  def consume(count):
+    get = structure.get
+    for _ in range(count):
+      get()
+
+  workers = [threading.Thread(target=produce) for _ in range(producers)]
+  workers += [threading.Thread(target=consume, args=(count,)) for count in per_consumer]
+  start = time.perf_counter()
+  for worker in workers:
+    worker.start()
+  for worker in workers:
+    worker.join()
+  return total, time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Multi-producer multi-consumer contention")
+  parser.add_argument("--items", type=int, default=200000)
+  parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+  parser.add_argument("--max-size", type=int, default=1024)
+  args = parser.parse_args()
+  structures = [
+    ("GlobalLockQueue", lambda: GlobalLockQueue(args.max_size)),
+    ("ConcurrentQueue", lambda: ConcurrentQueue(args.max_size)),
+    ("ConcurrentStack", lambda: ConcurrentStack(args.max_size)),
+    ("queue.Queue", lambda: queue.Queue(args.max_size)),
+  ]
+  print("{:<18}{:>8}{:>12}{:>16}".format("structure", "threads", "seconds", "items/s"))
+  for threads in args.threads:
+    for name, factory in structures:
+      total, elapsed = run(factory, args.items, threads)
+      print("{:<18}{:>8}{:>12.3f}{:>16,.0f}".format(name, threads, elapsed, total / elapsed))
+
+
+if __name__ == "__main__":
+  main()
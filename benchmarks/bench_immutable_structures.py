@@ -0,0 +1,133 @@
+# Compares the cost of taking a snapshot of a stack or a linked list, in time and in memory kept alive by the snapshot.
+# deepcopy   - copy.deepcopy() of a Stack or LinkedList; it recurses once per node, so it hits the recursion limit on all but tiny structures
+#              and those sizes are reported as n/a
+# rebuild    - copying the values into a new Stack or LinkedList, the copy a handler has to make today
+# snapshot   - Stack.snapshot(), which shares the stack's nodes
+# immutable  - keeping a reference to an ImmutableStack or ImmutableLinkedList version
+# For the immutable structures, every change also makes a new version, so the cost of push()/insert_beginning() is reported next to
+# the mutable classes as well.
+#
+# Usage: python benchmarks/bench_immutable_structures.py --sizes 100 10000 1000000 --repeat 5
+
+import argparse
+import copy
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Stacks import Stack
+from linear_data_structures.Linked_lists import LinkedList
+from linear_data_structures.Immutable_structures import ImmutableStack, ImmutableLinkedList
+
+
+def measure(make_snapshot, repeat):
+  best = None
+  for _ in range(repeat):
+    start = time.perf_counter()
+    make_snapshot()
+    elapsed = time.perf_counter() - start
+    best = elapsed if best is None else min(best, elapsed)
+  tracemalloc.start()
+  snapshot = make_snapshot()
+  retained = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  del snapshot
+  return best, retained
+
+
+def rebuild_stack(stack):
+  copied = Stack(stack.limit)
+  copied.push_many(reversed(list(stack)))
+  return copied
+
+
+def rebuild_linked_list(linked_list):
+  copied = LinkedList()
+  for value in reversed(list(linked_list)):
+    copied.insert_beginning(value)
+  return copied
+
+
+def deepcopy_or_none(structure):
+  def make_snapshot():
+    return copy.deepcopy(structure)
+  try:
+    make_snapshot()
+  except RecursionError:
+    return None
+  return make_snapshot
+
+
+def time_changes(change, count):
+  start = time.perf_counter()
+  change(count)
+  return (time.perf_counter() - start) / count
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Snapshot cost of the immutable structures")
+  parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 1000000])
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--changes", type=int, default=100000, help="pushes or inserts timed for the change cost")
+  args = parser.parse_args()
+  print("{:<22}{:<12}{:>10}{:>16}{:>16}".format("structure", "snapshot", "size", "us/snapshot", "bytes/snapshot"))
+  for size in args.sizes:
+    stack = Stack(limit=size + 1)
+    stack.push_many(range(size))
+    immutable_stack = ImmutableStack(limit=size + 1).push_many(range(size))
+    linked_list = LinkedList()
+    immutable_linked_list = ImmutableLinkedList()
+    for value in range(size):
+      linked_list.insert_beginning(value)
+      immutable_linked_list = immutable_linked_list.insert_beginning(value)
+    for name, method, make_snapshot in (
+      ("Stack", "deepcopy", deepcopy_or_none(stack)),
+      ("Stack", "rebuild", lambda: rebuild_stack(stack)),
+      ("Stack", "snapshot", stack.snapshot),
+      ("ImmutableStack", "immutable", lambda: immutable_stack),
+      ("LinkedList", "deepcopy", deepcopy_or_none(linked_list)),
+      ("LinkedList", "rebuild", lambda: rebuild_linked_list(linked_list)),
+      ("ImmutableLinkedList", "immutable", lambda: immutable_linked_list),
+    ):
+      if make_snapshot is None:
+        print("{:<22}{:<12}{:>10}{:>16}{:>16}".format(name, method, size, "n/a", "n/a"))
+        continue
+      seconds, retained = measure(make_snapshot, args.repeat)
+      print("{:<22}{:<12}{:>10}{:>16.2f}{:>16}".format(name, method, size, seconds * 1e6, retained))
+
+  def push_stack(count):
+    stack = Stack(limit=count)
+    for value in range(count):
+      stack.push(value)
+
+  def push_immutable_stack(count):
+    stack = ImmutableStack(limit=count)
+    for value in range(count):
+      stack = stack.push(value)
+
+  def insert_linked_list(count):
+    linked_list = LinkedList()
+    for value in range(count):
+      linked_list.insert_beginning(value)
+
+  def insert_immutable_linked_list(count):
+    linked_list = ImmutableLinkedList()
+    for value in range(count):
+      linked_list = linked_list.insert_beginning(value)
+
+  print()
+  print("{:<22}{:>12}".format("change", "ns/change"))
+  for name, change in (
+    ("Stack.push", push_stack),
+    ("ImmutableStack.push", push_immutable_stack),
+    ("LinkedList.insert", insert_linked_list),
+    ("ImmutableLinkedList", insert_immutable_linked_list),
+  ):
+    print("{:<22}{:>12.0f}".format(name, time_changes(change, args.changes) * 1e9))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,79 @@
+# Tracks the start-up cost of the package, which short-lived command line workers pay every time they run.
+# import       - the time "import linear_data_structures" takes in a fresh interpreter, read from python -X importtime
+#                (the cumulative column, so it includes anything the package imports)
+# first access - the time the first lookup of each structure takes, which imports the module that defines it
+# Every measurement runs in a new interpreter so nothing is cached in sys.modules; the median of --runs runs is reported.
+# The package is byte-compiled first, the way an installed package is, so the times do not include compiling the source
+# (which takes several times longer than the import itself and is skipped when PYTHONDONTWRITEBYTECODE is set).
+# The script exits with status 1 when the median import time is over --budget-ms, so it can gate a CI job.
+#
+# Usage: python benchmarks/bench_import.py --runs 20 --budget-ms 1
+
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from linear_data_structures import STRUCTURES
+
+PACKAGE = "linear_data_structures"
+
+FIRST_ACCESS = """
+import time
+import {package}
+start = time.perf_counter()
+{package}.{name}
+print(time.perf_counter() - start)
+"""
+
+
+def run_python(arguments):
+  return subprocess.run([sys.executable] + arguments, cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def import_time():
+  report = run_python(["-X", "importtime", "-c", "import " + PACKAGE]).stderr
+  for line in report.splitlines():
+    parts = line.split("|")
+    if len(parts) == 3 and parts[2].strip() == PACKAGE:
+      return int(parts[1]) / 1e6
+  raise RuntimeError("no import time reported for " + PACKAGE)
+
+
+def first_access_time(name):
+  return float(run_python(["-c", FIRST_ACCESS.format(package=PACKAGE, name=name)]).stdout)
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Package import and first access times")
+  parser.add_argument("--runs", type=int, default=20)
+  parser.add_argument("--budget-ms", type=float, default=1.0)
+  parser.add_argument("--no-first-access", action="store_true", help="only time the package import")
+  args = parser.parse_args()
+  compileall.compile_dir(os.path.join(ROOT, PACKAGE), quiet=1)
+  imports = [import_time() for _ in range(args.runs)]
+  median = statistics.median(imports)
+  print("{:<24}{:>12}{:>12}".format("", "median ms", "min ms"))
+  print("{:<24}{:>12.3f}{:>12.3f}".format("import", median * 1e3, min(imports) * 1e3))
+  if not args.no_first_access:
+    # Names that share a module share the same cost, so only the first name of each module is timed
+    timed_modules = set()
+    for name, module_name in STRUCTURES.items():
+      if module_name in timed_modules:
+        continue
+      timed_modules.add(module_name)
+      timings = [first_access_time(name) for _ in range(max(1, args.runs // 4))]
+      print("{:<24}{:>12.3f}{:>12.3f}".format(name, statistics.median(timings) * 1e3, min(timings) * 1e3))
+  if median * 1e3 > args.budget_ms:
+    print("Import takes {:.3f} ms, over the {:.3f} ms budget".format(median * 1e3, args.budget_ms))
+    sys.exit(1)
+  print("Import takes {:.3f} ms, within the {:.3f} ms budget".format(median * 1e3, args.budget_ms))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,53 @@
+# Compares remove_node() and contains() on a plain LinkedList and an indexed one (indexed=True) as the list grows.
+# For each size the list is filled with distinct values and then a fixed number of random values are looked up and removed,
+# so the time per operation shows how the cost grows with the list: linear without the index, flat with it.
+#
+# Usage: python benchmarks/bench_indexed_linked_list.py --sizes 1000 10000 100000 1000000 --operations 1000
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Linked_lists import LinkedList
+
+
+def build(size, indexed):
+  linked_list = LinkedList(0, indexed=indexed)
+  insert_beginning = linked_list.insert_beginning
+  for value in range(1, size):
+    insert_beginning(value)
+  return linked_list
+
+
+def run(size, operations, indexed):
+  linked_list = build(size, indexed)
+  values = random.Random(size).sample(range(size), min(operations, size))
+  start = time.perf_counter()
+  for value in values:
+    linked_list.contains(value)
+  contains = (time.perf_counter() - start) / len(values)
+  start = time.perf_counter()
+  for value in values:
+    linked_list.remove_node(value)
+  remove = (time.perf_counter() - start) / len(values)
+  return contains, remove
+
+
+def main():
+  parser = argparse.ArgumentParser(description="LinkedList with and without a value index")
+  parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+  parser.add_argument("--operations", type=int, default=1000)
+  args = parser.parse_args()
+  print("{:<12}{:>10}{:>18}{:>18}".format("list", "size", "contains us/op", "remove us/op"))
+  for size in args.sizes:
+    for name, indexed in (("plain", False), ("indexed", True)):
+      contains, remove = run(size, args.operations, indexed)
+      print("{:<12}{:>10}{:>18.2f}{:>18.2f}".format(name, size, contains * 1e6, remove * 1e6))
+
+
+if __name__ == "__main__":
+  main()
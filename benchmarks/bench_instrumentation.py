@@ -0,0 +1,74 @@
+# Measures what instrumentation costs on the hot path of a Queue, a Stack and a RingBufferQueue.
+# plain        - never instrumented
+# detached     - instrumented and then detached again, which should cost the same as plain
+# events       - instrument(structure): counts, high-water mark, rejections and dwell times
+# sampled      - instrument(structure, sample_every=100): the above plus latency sampling
+# Each run does the given number of add/remove pairs and is reported in nanoseconds per pair.
+#
+# Usage: python benchmarks/bench_instrumentation.py --operations 200000 --repeat 5
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Stacks import Stack
+from linear_data_structures.Ring_buffer_queues import RingBufferQueue
+from linear_data_structures.instrumentation import instrument
+
+
+def run_queue(structure, operations):
+  enqueue = structure.enqueue
+  dequeue = structure.dequeue
+  start = time.perf_counter()
+  for value in range(operations):
+    enqueue(value)
+    dequeue()
+  return time.perf_counter() - start
+
+
+def run_stack(structure, operations):
+  push = structure.push
+  pop = structure.pop
+  start = time.perf_counter()
+  for value in range(operations):
+    push(value)
+    pop()
+  return time.perf_counter() - start
+
+
+def prepare(factory, mode):
+  structure = factory()
+  if mode == "detached":
+    instrument(structure, sample_every=100).detach()
+  elif mode == "events":
+    instrument(structure)
+  elif mode == "sampled":
+    instrument(structure, sample_every=100)
+  return structure
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Instrumentation overhead")
+  parser.add_argument("--operations", type=int, default=200000)
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+  modes = ("plain", "detached", "events", "sampled")
+  print("{:<18}".format("structure") + "".join("{:>12}".format(mode) for mode in modes))
+  for name, factory, run in (
+    ("Queue", lambda: Queue(max_size=1000), run_queue),
+    ("RingBufferQueue", lambda: RingBufferQueue(max_size=1000), run_queue),
+    ("Stack", lambda: Stack(limit=1000), run_stack),
+  ):
+    row = "{:<18}".format(name)
+    for mode in modes:
+      best = min(run(prepare(factory, mode), args.operations) for _ in range(args.repeat))
+      row += "{:>12.0f}".format(best / args.operations * 1e9)
+    print(row)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,89 @@
+# Compares the O(1) min/max structures with rescanning the contents on every query.
+# window - a stream of random numbers through a SlidingWindow, asking for min, max and sum after every value,
+#          against a collections.deque window that calls min(), max() and sum() each time
+# stack  - pushing and popping on a MinMaxStack of the same size and asking for min and max after every operation,
+#          against a Stack that is rescanned by iterating over it
+# Rescans get slow quickly at large sizes, so the naive versions are timed over fewer steps; the results are reported per step.
+#
+# Usage: python benchmarks/bench_min_max.py --sizes 10 1000 100000 1000000 --steps 100000
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Stacks import Stack
+from linear_data_structures.Min_max_structures import MinMaxStack, SlidingWindow
+
+
+def window_tracked(size, stream):
+  window = SlidingWindow(size)
+  window.enqueue_many(stream[:size])
+  start = time.perf_counter()
+  for value in stream[size:]:
+    window.enqueue(value)
+    window.get_min()
+    window.get_max()
+    window.get_sum()
+  return time.perf_counter() - start
+
+
+def window_rescan(size, stream):
+  window = deque(stream[:size])
+  start = time.perf_counter()
+  for value in stream[size:]:
+    window.popleft()
+    window.append(value)
+    min(window)
+    max(window)
+    sum(window)
+  return time.perf_counter() - start
+
+
+def stack_tracked(size, stream):
+  stack = MinMaxStack(limit=size + 1)
+  stack.push_many(stream[:size])
+  start = time.perf_counter()
+  for value in stream[size:]:
+    stack.push(value)
+    stack.get_min()
+    stack.get_max()
+    stack.pop()
+  return time.perf_counter() - start
+
+
+def stack_rescan(size, stream):
+  stack = Stack(limit=size + 1)
+  stack.push_many(stream[:size])
+  start = time.perf_counter()
+  for value in stream[size:]:
+    stack.push(value)
+    min(stack)
+    max(stack)
+    stack.pop()
+  return time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="O(1) min/max tracking vs rescans")
+  parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000, 1000000])
+  parser.add_argument("--steps", type=int, default=100000)
+  parser.add_argument("--rescan-budget", type=int, default=10 ** 7, help="elements a naive run may scan in total")
+  args = parser.parse_args()
+  generator = random.Random(11)
+  print("{:<8}{:<8}{:>10}{:>16}{:>16}{:>10}".format("test", "", "size", "tracked us/step", "rescan us/step", "speedup"))
+  for size in args.sizes:
+    naive_steps = max(10, min(args.steps, args.rescan_budget // size))
+    stream = [generator.random() for _ in range(size + args.steps)]
+    for name, tracked, rescan in (("window", window_tracked, window_rescan), ("stack", stack_tracked, stack_rescan)):
+      tracked_step = tracked(size, stream) / args.steps
+      rescan_step = rescan(size, stream[:size + naive_steps]) / naive_steps
+      print("{:<16}{:>10}{:>16.2f}{:>16.2f}{:>9.2f}x".format(name, size, tracked_step * 1e6, rescan_step * 1e6, rescan_step / tracked_step))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,83 @@
+# Measures what a Node costs, using tracemalloc.
+# memory - bytes per node for a chain of nodes built with the old dict-based Node and the __slots__ Node from node.py
+# churn  - a Queue and a Stack cycling items through a small backlog, with and without a shared NodePool.
+#          Reports how many nodes had to be allocated, the tracemalloc peak and the time taken (tracing slows everything down, so the times are only comparable with each other).
+#
+# Usage: python benchmarks/bench_node_memory.py --nodes 1000000 --ops 1000000
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Stacks import Stack
+from linear_data_structures.node import Node, NodePool
+
+
+# The Node as it was written before __slots__, kept here as the baseline
+class DictNode:
+  def __init__(self, value, next_node=None):
+    self.value = value
+    self.next_node = next_node
+
+
+def bytes_per_node(node_class, count):
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  head = None
+  for i in range(count):
+    head = node_class(i, head)
+  after = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  # The ints themselves are allocated too (rounded up to 8 bytes by the allocator); subtract them so only the node overhead is left
+  ints = sum((sys.getsizeof(i) + 7) // 8 * 8 for i in range(257, count))
+  return (after - before - ints) / count, head
+
+
+def churn(structure, add, remove, ops, backlog=64):
+  add = getattr(structure, add)
+  remove = getattr(structure, remove)
+  for i in range(backlog):
+    add(i)
+  tracemalloc.start()
+  start = time.perf_counter()
+  for i in range(ops):
+    add(i)
+    remove()
+  elapsed = time.perf_counter() - start
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return elapsed, peak
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Node memory and allocation rate")
+  parser.add_argument("--nodes", type=int, default=10 ** 6)
+  parser.add_argument("--ops", type=int, default=10 ** 6)
+  args = parser.parse_args()
+
+  print("{:<12}{:>16}".format("node", "bytes/node"))
+  for name, node_class in (("DictNode", DictNode), ("Node", Node)):
+    per_node, head = bytes_per_node(node_class, args.nodes)
+    del head
+    print("{:<12}{:>16.1f}".format(name, per_node))
+
+  print()
+  print("{:<20}{:>16}{:>14}{:>12}".format("churn", "nodes allocated", "peak bytes", "seconds"))
+  for name, add, remove, factory in (
+    ("Queue", "enqueue", "dequeue", lambda pool: Queue(node_pool=pool)),
+    ("Stack", "push", "pop", lambda pool: Stack(limit=args.ops, node_pool=pool)),
+  ):
+    elapsed, peak = churn(factory(None), add, remove, args.ops)
+    print("{:<20}{:>16,}{:>14,}{:>12.3f}".format(name, args.ops + 64, peak, elapsed))
+    pool = NodePool()
+    elapsed, peak = churn(factory(pool), add, remove, args.ops)
+    print("{:<20}{:>16,}{:>14,}{:>12.3f}".format(name + " + NodePool", pool.created, peak, elapsed))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,73 @@
+# Compares the typed NumericStack and NumericQueue with the Node based Stack and Queue.
+# memory    - bytes per element while holding the given number of floats, measured with tracemalloc
+# batch     - moving the elements through in batches with push_many/pop_many and enqueue_many/dequeue_many
+# aggregate - summing the contents without removing them (iterating the Node based structures, sum() on the numeric ones)
+#
+# Usage: python benchmarks/bench_numeric_structures.py --elements 1000000 --batch 10000
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Stacks import Stack
+from linear_data_structures.Numeric_structures import NumericStack, NumericQueue
+
+
+def memory_per_element(factory, add_many, elements, values):
+  tracemalloc.start()
+  structure = factory()
+  getattr(structure, add_many)(values)
+  memory = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  return memory / elements, structure
+
+
+def batch_throughput(structure, add_many, remove_many, elements, batch):
+  add_many = getattr(structure, add_many)
+  remove_many = getattr(structure, remove_many)
+  values = array("d", range(batch))
+  start = time.perf_counter()
+  for _ in range(elements // batch):
+    add_many(values)
+    remove_many(batch)
+  return time.perf_counter() - start
+
+
+def aggregate(structure):
+  start = time.perf_counter()
+  if hasattr(structure, "sum"):
+    structure.sum()
+  else:
+    sum(structure)
+  return time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Typed numeric structures vs Node based ones")
+  parser.add_argument("--elements", type=int, default=10 ** 6)
+  parser.add_argument("--batch", type=int, default=10 ** 4)
+  args = parser.parse_args()
+  elements = args.elements
+  structures = [
+    ("Stack", lambda: Stack(limit=elements), "push_many", "pop_many"),
+    ("NumericStack", lambda: NumericStack(limit=elements), "push_many", "pop_many"),
+    ("Queue", lambda: Queue(), "enqueue_many", "dequeue_many"),
+    ("NumericQueue", lambda: NumericQueue(), "enqueue_many", "dequeue_many"),
+  ]
+  print("{:<14}{:>14}{:>18}{:>16}".format("structure", "bytes/element", "batch elements/s", "sum seconds"))
+  for name, factory, add_many, remove_many in structures:
+    per_element, structure = memory_per_element(factory, add_many, elements, array("d", (i * 0.5 for i in range(elements))))
+    sum_time = aggregate(structure)
+    del structure
+    elapsed = batch_throughput(factory(), add_many, remove_many, elements, args.batch)
+    print("{:<14}{:>14.1f}{:>18,.0f}{:>16.4f}".format(name, per_element, elements / elapsed, sum_time))
+
+
+if __name__ == "__main__":
+  main()
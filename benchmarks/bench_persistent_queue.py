@@ -0,0 +1,67 @@
+# Measures PersistentQueue throughput under different fsync policies.
+# Each run enqueues the given number of payloads into a fresh queue in a temporary directory, then dequeues them all,
+# once copying (dequeue) and once through zero-copy views (dequeue_view).
+# fsync_every=1 flushes after every operation, larger values batch the flushes, and None leaves flushing to the operating system.
+# The temporary directory must be on local disk; set TMPDIR to choose where it goes.
+#
+# Usage: python benchmarks/bench_persistent_queue.py --items 100000 --payload 256 --fsync-every 1 100 10000 none
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Persistent_queues import PersistentQueue
+
+
+def run(items, payload_size, fsync_every, segment_size):
+  directory = tempfile.mkdtemp(prefix="persistent-queue-")
+  payload = os.urandom(payload_size)
+  try:
+    results = []
+    for method in ("dequeue", "dequeue_view"):
+      queue = PersistentQueue(os.path.join(directory, method), segment_size=segment_size, fsync_every=fsync_every)
+      enqueue = queue.enqueue
+      start = time.perf_counter()
+      for _ in range(items):
+        enqueue(payload)
+      queue.sync()
+      enqueue_time = time.perf_counter() - start
+      dequeue = getattr(queue, method)
+      start = time.perf_counter()
+      for _ in range(items):
+        dequeue()
+      queue.sync()
+      dequeue_time = time.perf_counter() - start
+      queue.close()
+      results.append((method, enqueue_time, dequeue_time))
+    return results
+  finally:
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+  parser = argparse.ArgumentParser(description="PersistentQueue throughput by fsync policy")
+  parser.add_argument("--items", type=int, default=100000)
+  parser.add_argument("--payload", type=int, nargs="+", default=[64, 4096])
+  parser.add_argument("--fsync-every", nargs="+", default=["1", "100", "10000", "none"])
+  parser.add_argument("--segment-size", type=int, default=64 * 1024 * 1024)
+  args = parser.parse_args()
+  print("{:>12}{:>9}{:>14}{:>16}{:>14}{:>16}{:>14}".format(
+    "fsync_every", "payload", "read with", "enqueue ops/s", "enqueue MB/s", "dequeue ops/s", "dequeue MB/s"))
+  for payload_size in args.payload:
+    for policy in args.fsync_every:
+      fsync_every = None if policy.lower() == "none" else int(policy)
+      items = args.items if fsync_every != 1 else max(1, args.items // 100)
+      for method, enqueue_time, dequeue_time in run(items, payload_size, fsync_every, args.segment_size):
+        megabytes = items * payload_size / 1e6
+        print("{:>12}{:>9}{:>14}{:>16,.0f}{:>14.1f}{:>16,.0f}{:>14.1f}".format(
+          policy, payload_size, method, items / enqueue_time, megabytes / enqueue_time, items / dequeue_time, megabytes / dequeue_time))
+
+
+if __name__ == "__main__":
+  main()
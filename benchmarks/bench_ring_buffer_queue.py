@@ -0,0 +1,68 @@
+# Compares the linked Queue against the RingBufferQueue.
+# Each run performs the given number of operations in two patterns:
+# burst - enqueue half of the operations, then dequeue them all
+# steady - keep a small backlog and alternate enqueue and dequeue
+#
+# Usage: python benchmarks/bench_ring_buffer_queue.py --ops 1000000 10000000 100000000
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Ring_buffer_queues import RingBufferQueue
+
+
+def burst(queue, ops):
+  half = ops // 2
+  enqueue = queue.enqueue
+  dequeue = queue.dequeue
+  start = time.perf_counter()
+  for i in range(half):
+    enqueue(i)
+  for _ in range(half):
+    dequeue()
+  return time.perf_counter() - start
+
+
+def steady(queue, ops, backlog=64):
+  enqueue = queue.enqueue
+  dequeue = queue.dequeue
+  for i in range(backlog):
+    enqueue(i)
+  start = time.perf_counter()
+  for i in range(ops // 2):
+    enqueue(i)
+    dequeue()
+  return time.perf_counter() - start
+
+
+def run(ops):
+  results = []
+  factories = [
+    ("Queue", Queue),
+    ("RingBufferQueue", RingBufferQueue),
+    ("RingBufferQueue(max_size)", lambda: RingBufferQueue(max_size=ops)),
+  ]
+  for name, factory in factories:
+    for pattern, workload in (("burst", burst), ("steady", steady)):
+      elapsed = workload(factory(), ops)
+      results.append((name, pattern, elapsed))
+  return results
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Linked Queue vs RingBufferQueue")
+  parser.add_argument("--ops", type=int, nargs="+", default=[10 ** 6])
+  args = parser.parse_args()
+  print("{:<28}{:<8}{:>14}{:>12}{:>16}".format("queue", "pattern", "operations", "seconds", "ops/s"))
+  for ops in args.ops:
+    for name, pattern, elapsed in run(ops):
+      print("{:<28}{:<8}{:>14}{:>12.3f}{:>16,.0f}".format(name, pattern, ops, elapsed, ops / elapsed))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,107 @@
+# Runs a job scheduling workload through the priority queues.
+# priority - enqueue the jobs with random priorities, cancel some and raise the priority of others through their handles, then dequeue everything.
+#            PriorityQueue is compared with heapq, where cancelling means finding the job with a linear scan (index) and re-heapifying,
+#            which is what callers did without handles. The heapq run only cancels and reprioritizes up to --scan-limit jobs, since each one is O(n).
+# classes  - enqueue the jobs into three classes of a MultiLevelQueue with weights 5:2:1, cancel some, then dequeue everything,
+#            compared with a plain FIFO Queue that ignores the classes.
+#
+# Usage: python benchmarks/bench_scheduling.py --jobs 1000000 --cancel 0.1 --reprioritize 0.1
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Priority_queues import PriorityQueue, MultiLevelQueue
+
+
+def priority_queue_run(jobs, priorities, cancelled, reprioritized):
+  queue = PriorityQueue()
+  start = time.perf_counter()
+  handles = [queue.enqueue(job, priority) for job, priority in zip(jobs, priorities)]
+  for index in cancelled:
+    queue.cancel(handles[index])
+  for index in reprioritized:
+    if handles[index].is_queued():
+      queue.decrease_key(handles[index], 0)
+  while not queue.is_empty():
+    queue.dequeue()
+  return time.perf_counter() - start
+
+
+def heapq_run(jobs, priorities, cancelled, reprioritized):
+  heap = []
+  start = time.perf_counter()
+  entries = []
+  for sequence, (job, priority) in enumerate(zip(jobs, priorities)):
+    entry = [priority, sequence, job]
+    entries.append(entry)
+    heapq.heappush(heap, entry)
+  for index in cancelled:
+    heap.remove(entries[index])
+    heapq.heapify(heap)
+  for index in reprioritized:
+    entry = entries[index]
+    if entry in heap:
+      heap.remove(entry)
+      entry[0] = 0
+      heapq.heappush(heap, entry)
+  while heap:
+    heapq.heappop(heap)
+  return time.perf_counter() - start
+
+
+def multi_level_run(jobs, classes, cancelled):
+  queue = MultiLevelQueue([("interactive", 5), ("batch", 2), ("bulk", 1)])
+  start = time.perf_counter()
+  handles = [queue.enqueue(job, job_class) for job, job_class in zip(jobs, classes)]
+  for index in cancelled:
+    queue.cancel(handles[index])
+  while not queue.is_empty():
+    queue.dequeue()
+  return time.perf_counter() - start
+
+
+def fifo_run(jobs):
+  queue = Queue()
+  start = time.perf_counter()
+  for job in jobs:
+    queue.enqueue(job)
+  while not queue.is_empty():
+    queue.dequeue()
+  return time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Priority and multi-level scheduling")
+  parser.add_argument("--jobs", type=int, nargs="+", default=[10 ** 5, 10 ** 6])
+  parser.add_argument("--cancel", type=float, default=0.1)
+  parser.add_argument("--reprioritize", type=float, default=0.1)
+  parser.add_argument("--scan-limit", type=int, default=200)
+  args = parser.parse_args()
+  generator = random.Random(3)
+  print("{:<16}{:>10}{:>12}{:>16}".format("scheduler", "jobs", "seconds", "jobs/s"))
+  for count in args.jobs:
+    jobs = list(range(count))
+    priorities = [generator.randrange(100) for _ in jobs]
+    classes = [generator.choice(("interactive", "batch", "bulk")) for _ in jobs]
+    cancelled = generator.sample(jobs, int(count * args.cancel))
+    reprioritized = generator.sample(jobs, int(count * args.reprioritize))
+    limited_cancelled = cancelled[:args.scan_limit]
+    limited_reprioritized = reprioritized[:args.scan_limit]
+    for name, elapsed in (
+      ("PriorityQueue", priority_queue_run(jobs, priorities, cancelled, reprioritized)),
+      ("heapq + scans", heapq_run(jobs, priorities, limited_cancelled, limited_reprioritized)),
+      ("MultiLevelQueue", multi_level_run(jobs, classes, cancelled)),
+      ("Queue (FIFO)", fifo_run(jobs)),
+    ):
+      print("{:<16}{:>10}{:>12.3f}{:>16,.0f}".format(name, count, elapsed, count / elapsed))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,97 @@
+# Measures cross-process throughput: 1 to 16 producer processes each send their share of --messages payloads to one consumer, the main process.
+# mp.Queue     - one multiprocessing.Queue shared by all producers; every item is pickled and sent through a pipe
+# shm locked   - one SharedMemoryQueue shared by all producers, which take turns with a producer_lock
+# shm per prod - a single-producer SharedMemoryQueue for each producer, with no locks; the consumer reads them in turn
+# The shared memory consumer reads with dequeue_view(), so it never copies the payload; the mp.Queue consumer gets a new bytes object per item.
+# The timer starts once all producers are running and stops when the consumer has received every message.
+# With more producers than CPU cores, the numbers mostly measure the scheduler.
+#
+# Usage: python benchmarks/bench_shared_memory_queue.py --processes 1 2 4 8 16 --messages 200000 --payload 64
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Shared_memory_queues import SharedMemoryQueue
+
+
+def produce(queue, payload, count, ready, start):
+  ready.release()
+  start.wait()
+  put = queue.put
+  for _ in range(count):
+    put(payload)
+
+
+def run(name, producers, messages, payload_size, capacity):
+  payload = b"x" * payload_size
+  per_producer = messages // producers
+  total = per_producer * producers
+  ready = multiprocessing.Semaphore(0)
+  start = multiprocessing.Event()
+  if name == "mp.Queue":
+    queues = [multiprocessing.Queue(capacity)] * producers
+  elif name == "shm locked":
+    queues = [SharedMemoryQueue(capacity, payload_size, producer_lock=multiprocessing.Lock())] * producers
+  else:
+    queues = [SharedMemoryQueue(capacity, payload_size) for _ in range(producers)]
+  processes = [multiprocessing.Process(target=produce, args=(queue, payload, per_producer, ready, start)) for queue in queues]
+  for process in processes:
+    process.start()
+  for _ in processes:
+    ready.acquire()
+  began = time.perf_counter()
+  start.set()
+  received = 0
+  if name == "mp.Queue":
+    get = queues[0].get
+    while received < total:
+      get()
+      received += 1
+  elif name == "shm locked":
+    queue = queues[0]
+    while received < total:
+      queue.get()
+      received += 1
+  else:
+    while received < total:
+      idle = True
+      for queue in queues:
+        while queue.has_items():
+          queue.dequeue_view()
+          received += 1
+          idle = False
+      if idle:
+        time.sleep(0)
+  elapsed = time.perf_counter() - began
+  for process in processes:
+    process.join()
+  for queue in set(queues):
+    if isinstance(queue, SharedMemoryQueue):
+      queue.close()
+  return total / elapsed
+
+
+def main():
+  parser = argparse.ArgumentParser(description="SharedMemoryQueue vs multiprocessing.Queue throughput")
+  parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+  parser.add_argument("--messages", type=int, default=200000)
+  parser.add_argument("--payload", type=int, default=64, help="payload size in bytes")
+  parser.add_argument("--capacity", type=int, default=1024, help="queue max_size")
+  args = parser.parse_args()
+  names = ("mp.Queue", "shm locked", "shm per prod")
+  print("{:<12}".format("producers") + "".join("{:>18}".format(name + " k/s") for name in names))
+  for producers in args.processes:
+    row = "{:<12}".format(producers)
+    for name in names:
+      rate = run(name, producers, args.messages, args.payload, args.capacity)
+      row += "{:>18.0f}".format(rate / 1000)
+    print(row)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,83 @@
+# Compares a SkipList with a sorted Python list kept in order with bisect, for sorted timestamps.
+# search - find(value) against bisect_left() and a comparison
+# insert - insert(value) against bisect.insort(), which shifts the tail of the list over in memory
+# remove - remove_node(value) against bisect_left() and del
+# rank   - rank(value) against bisect_left()
+# get    - get(index) against indexing the list
+# range  - reading the first --scan values of range(start, stop) against bisect_left() and a slice
+# Every operation is timed --operations times on a structure of each size and reported in microseconds per operation.
+# The list wins whenever it doesn't have to move memory, since bisect runs in C; the skip list wins on inserts and removes once the list is large.
+# A SkipList uses roughly 200 bytes per value, so 10^7 values need about 2 GB of memory.
+#
+# Usage: python benchmarks/bench_skip_list.py --sizes 10000 100000 1000000 10000000 --operations 10000
+
+import argparse
+import bisect
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Skip_lists import SkipList
+
+
+def timed(function, arguments):
+  start = time.perf_counter()
+  for argument in arguments:
+    function(argument)
+  return (time.perf_counter() - start) / len(arguments)
+
+
+def main():
+  parser = argparse.ArgumentParser(description="SkipList vs a sorted list with bisect")
+  parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+  parser.add_argument("--operations", type=int, default=10000)
+  parser.add_argument("--scan", type=int, default=100, help="values read per range query")
+  args = parser.parse_args()
+  generator = random.Random(5)
+  print("{:<10}{:>10}{:>16}{:>16}{:>10}".format("operation", "size", "skip list us", "bisect us", "speedup"))
+  for size in args.sizes:
+    timestamps = [generator.random() * size for _ in range(size)]
+    start = time.perf_counter()
+    skip_list = SkipList(timestamps)
+    build_seconds = time.perf_counter() - start
+    ordered = sorted(timestamps)
+    print("{:<10}{:>10}{:>16.0f}{:>16}".format("build", size, build_seconds * 1e6, ""))
+    existing = generator.sample(ordered, min(args.operations, size))
+    new_values = [generator.random() * size for _ in range(args.operations)]
+    indexes = [generator.randrange(size) for _ in range(args.operations)]
+    scan_starts = [generator.random() * size for _ in range(args.operations)]
+    scan_width = args.scan * 2
+
+    def list_search(value):
+      index = bisect.bisect_left(ordered, value)
+      return index < len(ordered) and ordered[index] == value
+
+    def list_remove(value):
+      del ordered[bisect.bisect_left(ordered, value)]
+
+    def list_range(start):
+      begin = bisect.bisect_left(ordered, start)
+      end = bisect.bisect_left(ordered, start + scan_width, begin)
+      return ordered[begin:min(end, begin + args.scan)]
+
+    def skip_list_range(start):
+      return list(skip_list.range(start, start + scan_width).take(args.scan))
+
+    for name, skip_list_operation, list_operation, arguments in (
+      ("search", skip_list.find, list_search, existing),
+      ("insert", skip_list.insert, lambda value: bisect.insort(ordered, value), new_values),
+      ("remove", skip_list.remove_node, list_remove, new_values),
+      ("rank", skip_list.rank, lambda value: bisect.bisect_left(ordered, value), existing),
+      ("get", skip_list.get, ordered.__getitem__, indexes),
+      ("range", skip_list_range, list_range, scan_starts),
+    ):
+      skip_list_seconds = timed(skip_list_operation, arguments)
+      list_seconds = timed(list_operation, arguments)
+      print("{:<10}{:>10}{:>16.2f}{:>16.2f}{:>9.1f}x".format(name, size, skip_list_seconds * 1e6, list_seconds * 1e6, list_seconds / skip_list_seconds))
+
+
+if __name__ == "__main__":
+  main()
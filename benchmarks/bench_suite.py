@@ -0,0 +1,403 @@
+# The full benchmark suite: every basic structure in the project next to the standard library containers that do the same job.
+# node        - creating Nodes, chaining them and walking the chain, against (value, next) tuples
+# linked_list - LinkedList (plain and indexed) insert_beginning, traversal and remove_node, against list and collections.deque
+#               removals are timed from the front, the back and random positions of the list
+# fifo        - Queue unbounded and with max_size, against collections.deque, list and queue.Queue
+# lifo        - Stack with a limit, against list, collections.deque and queue.LifoQueue
+# FIFO and LIFO structures are driven with three access patterns:
+#   fill-drain - add every value, then remove them all
+#   steady     - start full and alternate one removal with one add
+#   burst      - add and remove in bursts of 64
+# Every case runs for each data size and each payload type (int, str, tuple and a small object) and keeps the best of --repeat runs.
+# Cases that are quadratic for a baseline, like list.pop(0) or list.insert(0, value), are skipped above --quadratic-limit.
+#
+# run saves the results as JSON, and compare matches two result files case by case and flags every case that got slower by more than --threshold.
+# compare exits with status 1 when it found a regression, so it can gate a CI job. Timings from different machines are not comparable.
+#
+# Usage: python benchmarks/bench_suite.py run --sizes 100 10000 100000 --output before.json
+#        python benchmarks/bench_suite.py run --groups fifo lifo --payloads int --output after.json
+#        python benchmarks/bench_suite.py compare before.json after.json --threshold 0.10
+
+import argparse
+import gc
+import json
+import os
+import platform
+import queue
+import random
+import sys
+import time
+from collections import deque
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Queues import Queue
+from linear_data_structures.Linked_lists import LinkedList
+from linear_data_structures.Stacks import Stack
+from linear_data_structures.node import Node
+
+BURST = 64
+REMOVALS = 1000
+
+
+class Payload:
+  __slots__ = ("number",)
+
+  def __init__(self, number):
+    self.number = number
+
+
+PAYLOADS = {
+  "int": lambda size: list(range(size)),
+  "str": lambda size: ["item-{}".format(number) for number in range(size)],
+  "tuple": lambda size: [(number, "item") for number in range(size)],
+  "object": lambda size: [Payload(number) for number in range(size)],
+}
+
+
+# FIFO and LIFO implementations take the data size and return an (add, remove) pair of callables
+
+def queue_unbounded(size):
+  fifo = Queue()
+  return fifo.enqueue, fifo.dequeue
+
+
+def queue_bounded(size):
+  fifo = Queue(max_size=size)
+  return fifo.enqueue, fifo.dequeue
+
+
+def deque_fifo(size):
+  fifo = deque()
+  return fifo.append, fifo.popleft
+
+
+def list_fifo(size):
+  fifo = []
+  return fifo.append, partial(fifo.pop, 0)
+
+
+def queue_module_fifo(size):
+  fifo = queue.Queue(maxsize=size)
+  return fifo.put_nowait, fifo.get_nowait
+
+
+def stack_limit(size):
+  lifo = Stack(limit=size)
+  return lifo.push, lifo.pop
+
+
+def list_lifo(size):
+  lifo = []
+  return lifo.append, lifo.pop
+
+
+def deque_lifo(size):
+  lifo = deque()
+  return lifo.append, lifo.pop
+
+
+def queue_module_lifo(size):
+  lifo = queue.LifoQueue(maxsize=size)
+  return lifo.put_nowait, lifo.get_nowait
+
+
+FIFO = [
+  ("Queue", queue_unbounded, False),
+  ("Queue(max_size)", queue_bounded, False),
+  ("deque", deque_fifo, False),
+  ("list", list_fifo, True),
+  ("queue.Queue", queue_module_fifo, False),
+]
+
+LIFO = [
+  ("Stack(limit)", stack_limit, False),
+  ("list", list_lifo, False),
+  ("deque", deque_lifo, False),
+  ("queue.LifoQueue", queue_module_lifo, False),
+]
+
+
+# Access patterns get (add, remove) and the payload values, and return a callable to time along with the number of operations it does
+
+def fill_drain(add, remove, values):
+  def run():
+    for value in values:
+      add(value)
+    for _ in values:
+      remove()
+  return run, 2 * len(values)
+
+
+def steady(add, remove, values):
+  for value in values:
+    add(value)
+
+  def run():
+    for value in values:
+      remove()
+      add(value)
+  return run, 2 * len(values)
+
+
+def burst(add, remove, values):
+  bursts = [values[start:start + BURST] for start in range(0, len(values), BURST)]
+
+  def run():
+    for chunk in bursts:
+      for value in chunk:
+        add(value)
+      for _ in chunk:
+        remove()
+  return run, 2 * len(values)
+
+
+PATTERNS = [("fill-drain", fill_drain), ("steady", steady), ("burst", burst)]
+
+
+def fifo_cases(size, values):
+  for implementation, factory, quadratic in FIFO:
+    for pattern, setup in PATTERNS:
+      add, remove = factory(size)
+      yield "fifo", implementation, "enqueue-dequeue", pattern, quadratic, setup(add, remove, values)
+
+
+def lifo_cases(size, values):
+  for implementation, factory, quadratic in LIFO:
+    for pattern, setup in PATTERNS:
+      add, remove = factory(size)
+      yield "lifo", implementation, "push-pop", pattern, quadratic, setup(add, remove, values)
+
+
+def node_cases(size, values):
+  def create_nodes():
+    for value in values:
+      Node(value)
+
+  def create_tuples():
+    for value in values:
+      (value, None)
+
+  def chain_nodes():
+    chain = None
+    for value in values:
+      chain = Node(value, chain)
+
+  def chain_tuples():
+    chain = None
+    for value in values:
+      chain = (value, chain)
+
+  node_chain = None
+  tuple_chain = None
+  for value in values:
+    node_chain = Node(value, node_chain)
+    tuple_chain = (value, tuple_chain)
+
+  def walk_nodes():
+    current = node_chain
+    while current is not None:
+      current.value
+      current = current.next_node
+
+  def walk_tuples():
+    current = tuple_chain
+    while current is not None:
+      current[0]
+      current = current[1]
+
+  for operation, node_run, tuple_run in (("create", create_nodes, create_tuples), ("chain", chain_nodes, chain_tuples), ("walk", walk_nodes, walk_tuples)):
+    yield "node", "Node", operation, "-", False, (node_run, len(values))
+    yield "node", "tuple", operation, "-", False, (tuple_run, len(values))
+
+
+def linked_list_cases(size, values):
+  removals = min(len(values), REMOVALS)
+  # insert_beginning puts the last value at the head, so the other containers are built in the same order
+  order = values[::-1]
+  generator = random.Random(size)
+  removal_orders = [
+    ("front", order[:removals]),
+    ("back", order[::-1][:removals]),
+    ("random", generator.sample(order, removals)),
+  ]
+
+  def linked_list(indexed):
+    built = LinkedList(indexed=indexed)
+    for value in values:
+      built.insert_beginning(value)
+    return built
+
+  def insert_linked_list():
+    built = LinkedList()
+    for value in values:
+      built.insert_beginning(value)
+
+  def insert_list():
+    built = []
+    for value in values:
+      built.insert(0, value)
+
+  def insert_deque():
+    built = deque()
+    for value in values:
+      built.appendleft(value)
+
+  yield "linked_list", "LinkedList", "insert", "beginning", False, (insert_linked_list, len(values))
+  yield "linked_list", "list", "insert", "beginning", True, (insert_list, len(values))
+  yield "linked_list", "deque", "insert", "beginning", False, (insert_deque, len(values))
+
+  for implementation, container in (("LinkedList", linked_list(False)), ("list", list(order)), ("deque", deque(order))):
+    def traverse(container=container):
+      for _ in container:
+        pass
+    yield "linked_list", implementation, "traverse", "-", False, (traverse, len(values))
+
+  # Removal empties the structure, so every run gets a fresh copy and the copy is built outside the timed part
+  for pattern, targets in removal_orders:
+    for implementation, build, quadratic in (
+      ("LinkedList", partial(linked_list, False), True),
+      ("LinkedList(indexed)", partial(linked_list, True), False),
+      ("list", partial(list, order), True),
+      ("deque", partial(deque, order), True),
+    ):
+      remove_method = "remove_node" if implementation.startswith("LinkedList") else "remove"
+      yield "linked_list", implementation, "remove", pattern, quadratic and pattern != "front", (Removal(build, remove_method, targets), removals)
+
+
+class Removal:
+  def __init__(self, build, remove_method, targets):
+    self.build = build
+    self.remove_method = remove_method
+    self.targets = targets
+    self.container = None
+
+  def prepare(self):
+    self.container = self.build()
+
+  def __call__(self):
+    remove = getattr(self.container, self.remove_method)
+    for value in self.targets:
+      remove(value)
+
+
+GROUPS = {"node": node_cases, "linked_list": linked_list_cases, "fifo": fifo_cases, "lifo": lifo_cases}
+
+
+def time_case(run, repeat):
+  timings = []
+  gc_was_enabled = gc.isenabled()
+  gc.disable()
+  try:
+    for _ in range(repeat):
+      if hasattr(run, "prepare"):
+        run.prepare()
+      start = time.perf_counter()
+      run()
+      timings.append(time.perf_counter() - start)
+  finally:
+    if gc_was_enabled:
+      gc.enable()
+  return timings
+
+
+def case_name(result):
+  return "/".join(str(result[part]) for part in ("group", "implementation", "operation", "pattern", "payload", "size"))
+
+
+def run_suite(args):
+  results = []
+  print("{:<60}{:>14}".format("case", "ns/op"))
+  for group in args.groups:
+    for size in args.sizes:
+      for payload in args.payloads:
+        values = PAYLOADS[payload](size)
+        for group_name, implementation, operation, pattern, quadratic, (run, operations) in GROUPS[group](size, values):
+          if quadratic and size > args.quadratic_limit:
+            continue
+          timings = time_case(run, args.repeat)
+          result = {
+            "group": group_name,
+            "implementation": implementation,
+            "operation": operation,
+            "pattern": pattern,
+            "payload": payload,
+            "size": size,
+            "operations": operations,
+            "best_seconds": min(timings),
+            "ns_per_op": min(timings) / operations * 1e9,
+            "timings": timings,
+          }
+          result["name"] = case_name(result)
+          results.append(result)
+          print("{:<60}{:>14.1f}".format(result["name"], result["ns_per_op"]))
+  report = {
+    "meta": {
+      "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+      "python": sys.version,
+      "implementation": platform.python_implementation(),
+      "platform": platform.platform(),
+      "machine": platform.machine(),
+      "repeat": args.repeat,
+    },
+    "results": results,
+  }
+  with open(args.output, "w") as results_file:
+    json.dump(report, results_file, indent=2)
+  print("Saved {} results to {}".format(len(results), args.output))
+
+
+def compare(args):
+  with open(args.baseline) as baseline_file:
+    baseline = {result["name"]: result for result in json.load(baseline_file)["results"]}
+  with open(args.current) as current_file:
+    current = {result["name"]: result for result in json.load(current_file)["results"]}
+  regressions = 0
+  print("{:<60}{:>12}{:>12}{:>10}".format("case", "before ns", "after ns", "change"))
+  for name, result in current.items():
+    if name not in baseline:
+      continue
+    before = baseline[name]["ns_per_op"]
+    after = result["ns_per_op"]
+    change = after / before - 1
+    if change > args.threshold:
+      regressions += 1
+      flag = "  REGRESSION"
+    elif change < -args.threshold:
+      flag = "  faster"
+    elif args.all:
+      flag = ""
+    else:
+      continue
+    print("{:<60}{:>12.1f}{:>12.1f}{:>+9.1%}{}".format(name, before, after, change, flag))
+  missing = [name for name in baseline if name not in current]
+  added = [name for name in current if name not in baseline]
+  print("{} regressions above {:.0%}, {} cases only in the baseline, {} new cases".format(regressions, args.threshold, len(missing), len(added)))
+  return 1 if regressions else 0
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Benchmark suite for the linear data structures")
+  commands = parser.add_subparsers(dest="command", required=True)
+  run_parser = commands.add_parser("run", help="run the benchmarks and save the results as JSON")
+  run_parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 100000])
+  run_parser.add_argument("--payloads", nargs="+", choices=sorted(PAYLOADS), default=sorted(PAYLOADS))
+  run_parser.add_argument("--groups", nargs="+", choices=sorted(GROUPS), default=sorted(GROUPS))
+  run_parser.add_argument("--repeat", type=int, default=5)
+  run_parser.add_argument("--quadratic-limit", type=int, default=10000, help="largest size for cases that are O(n^2)")
+  run_parser.add_argument("--output", default="benchmark_results.json")
+  compare_parser = commands.add_parser("compare", help="flag the cases that got slower between two result files")
+  compare_parser.add_argument("baseline")
+  compare_parser.add_argument("current")
+  compare_parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown that counts as a regression")
+  compare_parser.add_argument("--all", action="store_true", help="also list the cases within the threshold")
+  args = parser.parse_args()
+  if args.command == "run":
+    run_suite(args)
+  else:
+    sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+  main()
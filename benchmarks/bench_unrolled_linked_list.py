@@ -0,0 +1,70 @@
+# Compares an UnrolledLinkedList with the LinkedList and the built-in list.
+# traverse - summing every value by iterating over the structure
+# memory   - bytes per value measured with tracemalloc while the structure is built (the values themselves are shared small ints and not counted)
+#
+# Usage: python benchmarks/bench_unrolled_linked_list.py --sizes 100000 1000000 --block-size 16 64 256
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linear_data_structures.Linked_lists import LinkedList
+from linear_data_structures.Unrolled_linked_lists import UnrolledLinkedList
+
+
+def build_linked_list(size):
+  linked_list = LinkedList()
+  for _ in range(size):
+    linked_list.insert_beginning(1)
+  return linked_list
+
+
+def build_unrolled(block_size):
+  def build(size):
+    unrolled = UnrolledLinkedList(block_size)
+    for _ in range(size):
+      unrolled.insert_end(1)
+    return unrolled
+  return build
+
+
+def build_list(size):
+  values = []
+  for _ in range(size):
+    values.append(1)
+  return values
+
+
+def measure(build, size):
+  tracemalloc.start()
+  structure = build(size)
+  memory = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  start = time.perf_counter()
+  total = 0
+  for value in structure:
+    total += value
+  return memory / size, time.perf_counter() - start
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Unrolled linked list traversal and memory")
+  parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 5, 10 ** 6])
+  parser.add_argument("--block-size", type=int, nargs="+", default=[16, 64, 256])
+  args = parser.parse_args()
+  structures = [("LinkedList", build_linked_list)]
+  structures += [("Unrolled({})".format(block_size), build_unrolled(block_size)) for block_size in args.block_size]
+  structures.append(("list", build_list))
+  print("{:<16}{:>10}{:>14}{:>18}".format("structure", "size", "bytes/value", "traverse ns/value"))
+  for size in args.sizes:
+    for name, build in structures:
+      per_value, elapsed = measure(build, size)
+      print("{:<16}{:>10}{:>14.1f}{:>18.1f}".format(name, size, per_value, elapsed / size * 1e9))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,124 @@
+# Event-loop code cannot block a thread while it waits for a queue, but it can suspend a coroutine.
+# AsyncQueue keeps the bounded Queue semantics (max_size, has_space) with awaitable enqueue() and dequeue():
+# await enqueue() suspends while the queue is full and await dequeue() suspends while it is empty.
+
+# Waiting coroutines are parked in two lines of their own, getters and putters, each holding a future.
+# Nothing polls. When an item arrives and a getter is waiting, the item is handed straight to the first getter's future.
+# When an item leaves a full queue, the value of the first waiting putter moves into the freed slot and that putter is released.
+# Handing values over directly means waiters are served strictly in the order they started waiting, and a newcomer can never jump the line.
+
+# A waiter that is cancelled before its turn just leaves a cancelled future behind, which is skipped when its turn comes.
+# A getter cancelled after it was handed a value passes the value on, so nothing is lost. If the queue has filled up again in the meantime,
+# the value goes back to the front of the queue and the newest item steps out to the front of the putters' line, so the queue never grows past max_size.
+# A putter whose value was already moved into the queue has finished its put, so cancelling it at that point is ignored and enqueue() returns normally;
+# raising there would make a caller that retries enqueue the value twice.
+
+import asyncio
+from collections import deque
+from .exceptions import QueueFull, QueueEmpty
+
+class AsyncQueue:
+  def __init__(self, max_size=None):
+    self.items = deque()
+    self.max_size = max_size
+    self.getters = deque()
+    self.putters = deque()
+
+  async def enqueue(self, value):
+    if self.has_space():
+      self.enqueue_nowait(value)
+    else:
+      putter = asyncio.get_running_loop().create_future()
+      self.putters.append((putter, value))
+      try:
+        await putter
+      except asyncio.CancelledError:
+        if putter.done() and not putter.cancelled():
+          return
+        raise
+
+  def enqueue_nowait(self, value):
+    if not self.has_space():
+      raise QueueFull("Sorry, no more room!")
+    self.hand_over(value)
+
+  def try_enqueue(self, value):
+    if not self.has_space():
+      return False
+    self.hand_over(value)
+    return True
+
+  async def dequeue(self):
+    if self.items:
+      return self.take()
+    getter = asyncio.get_running_loop().create_future()
+    self.getters.append(getter)
+    try:
+      return await getter
+    except asyncio.CancelledError:
+      if getter.done() and not getter.cancelled():
+        self.hand_back(getter.result())
+      raise
+
+  def dequeue_nowait(self):
+    if not self.items:
+      raise QueueEmpty("This queue is totally empty!")
+    return self.take()
+
+  def try_dequeue(self, default=None):
+    if not self.items:
+      return default
+    return self.take()
+
+  def peek(self):
+    if not self.items:
+      raise QueueEmpty("Nothing to see here!")
+    return self.items[0]
+
+  def get_size(self):
+    return len(self.items)
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.get_size()
+
+  def is_empty(self):
+    return not self.items
+
+  # Gives a new value to the first waiting getter, or stores it when nobody is waiting
+  def hand_over(self, value):
+    getters = self.getters
+    while getters:
+      getter = getters.popleft()
+      if not getter.done():
+        getter.set_result(value)
+        return
+    self.items.append(value)
+
+  # Like hand_over(), but a value returned by a cancelled getter goes back to the front of the line.
+  # When the queue is full, the newest item makes room by waiting at the front of the putters' line. Its putter has already
+  # returned, so it waits on a fresh future that nobody awaits.
+  def hand_back(self, value):
+    getters = self.getters
+    while getters:
+      getter = getters.popleft()
+      if not getter.done():
+        getter.set_result(value)
+        return
+    if not self.has_space():
+      self.putters.appendleft((asyncio.get_running_loop().create_future(), self.items.pop()))
+    self.items.appendleft(value)
+
+  # Removes the head item and lets the first waiting putter into the freed slot
+  def take(self):
+    value = self.items.popleft()
+    putters = self.putters
+    while putters:
+      putter, waiting_value = putters.popleft()
+      if not putter.done():
+        self.items.append(waiting_value)
+        putter.set_result(None)
+        break
+    return value
@@ -0,0 +1,347 @@
+# A cache keeps the results of expensive lookups around so the next request for the same key is cheap.
+# It can only hold so much, so when it is full it has to pick an entry to evict. The classes here differ in how they pick:
+# LRUCache           - evicts the least recently used entry
+# LFUCache           - evicts the least frequently used entry, and the least recently used among equally frequent ones
+# SegmentedLRUCache  - new entries start in a probation segment and move to a protected segment once they are hit again,
+#                      so a burst of one-off keys cannot flush out the entries that are used all the time
+
+# All three are built from DoublyLinkedList, which keeps entries in order and can unlink any of them in O(1) through the node handle.
+# A dictionary maps each key to its node, so get(), put() and every eviction are O(1).
+
+# The limit is either a number of entries (max_size) or a total weight (max_weight), or both.
+# The weight of an entry comes from weigher(key, value), for example the size of the value in bytes; without a weigher every entry weighs 1.
+# An entry that is heavier than max_weight on its own is never stored.
+# Every cache counts hits, misses and evictions; stats() returns them as a dict.
+
+from functools import wraps
+from .Doubly_linked_lists import DoublyLinkedList
+
+# Returned by get() internally so that a cached None can be told apart from a miss
+MISSING = object()
+
+class CacheEntry:
+  __slots__ = ("key", "value", "weight", "location")
+
+  def __init__(self, key, value, weight, location=None):
+    self.key = key
+    self.value = value
+    self.weight = weight
+    self.location = location
+
+class Cache:
+  def __init__(self, max_size=128, max_weight=None, weigher=None):
+    self.max_size = max_size
+    self.max_weight = max_weight
+    self.weigher = weigher
+    self.entries = {}
+    self.weight = 0
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def weigh(self, key, value):
+    if self.weigher is None:
+      return 1
+    return self.weigher(key, value)
+
+  def is_over_limit(self):
+    if self.max_size is not None and len(self.entries) > self.max_size:
+      return True
+    return self.max_weight is not None and self.weight > self.max_weight
+
+  def fits(self, weight):
+    return self.max_weight is None or weight <= self.max_weight
+
+  def contains(self, key):
+    return key in self.entries
+
+  def get_size(self):
+    return len(self.entries)
+
+  def get_weight(self):
+    return self.weight
+
+  def stats(self):
+    lookups = self.hits + self.misses
+    return {
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "hit_rate": self.hits / lookups if lookups else 0.0,
+      "size": len(self.entries),
+      "weight": self.weight,
+    }
+
+# The list runs from the least recently used entry at the head to the most recently used at the tail.
+# A hit moves the entry's node to the tail and an eviction removes the head.
+
+class LRUCache(Cache):
+  def __init__(self, max_size=128, max_weight=None, weigher=None):
+    super().__init__(max_size, max_weight, weigher)
+    self.order = DoublyLinkedList()
+
+  def get(self, key, default=None):
+    node = self.entries.get(key)
+    if node is None:
+      self.misses += 1
+      return default
+    self.hits += 1
+    self.order.move_to_end(node)
+    return node.value.value
+
+  def put(self, key, value):
+    weight = self.weigh(key, value)
+    node = self.entries.get(key)
+    if not self.fits(weight):
+      if node is not None:
+        self.remove(key)
+      return
+    if node is None:
+      self.entries[key] = self.order.insert_end(CacheEntry(key, value, weight))
+    else:
+      entry = node.value
+      self.weight -= entry.weight
+      entry.value = value
+      entry.weight = weight
+      self.order.move_to_end(node)
+    self.weight += weight
+    while self.is_over_limit():
+      self.evict()
+
+  def remove(self, key):
+    node = self.entries.pop(key, None)
+    if node is not None:
+      entry = self.order.remove(node)
+      self.weight -= entry.weight
+      return entry.value
+
+  def evict(self):
+    entry = self.order.remove(self.order.head_node)
+    del self.entries[entry.key]
+    self.weight -= entry.weight
+    self.evictions += 1
+
+  def clear(self):
+    self.entries = {}
+    self.order = DoublyLinkedList()
+    self.weight = 0
+
+# Entries with the same number of hits share a bucket, and the buckets sit in their own DoublyLinkedList in order of increasing frequency.
+# A hit moves the entry into the bucket for the next frequency, creating that bucket right after the current one if needed,
+# so there is never any searching. Evictions take the oldest entry of the first (least frequent) bucket.
+
+class FrequencyBucket:
+  __slots__ = ("frequency", "entries")
+
+  def __init__(self, frequency):
+    self.frequency = frequency
+    self.entries = DoublyLinkedList()
+
+class LFUCache(Cache):
+  def __init__(self, max_size=128, max_weight=None, weigher=None):
+    super().__init__(max_size, max_weight, weigher)
+    self.buckets = DoublyLinkedList()
+
+  def get(self, key, default=None):
+    node = self.entries.get(key)
+    if node is None:
+      self.misses += 1
+      return default
+    self.hits += 1
+    self.touch(node)
+    return node.value.value
+
+  def put(self, key, value):
+    weight = self.weigh(key, value)
+    node = self.entries.get(key)
+    if not self.fits(weight):
+      if node is not None:
+        self.remove(key)
+      return
+    if node is None:
+      self.weight += weight
+      # Make room before adding, so the new entry is not the one that gets evicted
+      while self.is_over_limit() or (self.max_size is not None and len(self.entries) >= self.max_size):
+        if not self.entries:
+          break
+        self.evict()
+      first = self.buckets.head_node
+      if first is None or first.value.frequency != 1:
+        first = self.buckets.insert_beginning(FrequencyBucket(1))
+      entry = CacheEntry(key, value, weight, first)
+      self.entries[key] = first.value.entries.insert_end(entry)
+    else:
+      entry = node.value
+      self.weight += weight - entry.weight
+      entry.value = value
+      entry.weight = weight
+      self.touch(node)
+      while self.is_over_limit():
+        self.evict()
+
+  # Moves an entry up to the next frequency bucket and returns its new node
+  def touch(self, node):
+    entry = node.value
+    bucket_node = entry.location
+    bucket = bucket_node.value
+    next_bucket_node = bucket_node.next_node
+    if next_bucket_node is None or next_bucket_node.value.frequency != bucket.frequency + 1:
+      next_bucket_node = self.buckets.insert_after(bucket_node, FrequencyBucket(bucket.frequency + 1))
+    bucket.entries.remove(node)
+    if bucket.entries.is_empty():
+      self.buckets.remove(bucket_node)
+    entry.location = next_bucket_node
+    new_node = next_bucket_node.value.entries.insert_end(entry)
+    self.entries[entry.key] = new_node
+    return new_node
+
+  def remove(self, key):
+    node = self.entries.pop(key, None)
+    if node is not None:
+      entry = self.unlink(node)
+      self.weight -= entry.weight
+      return entry.value
+
+  def unlink(self, node):
+    bucket_node = node.value.location
+    entry = bucket_node.value.entries.remove(node)
+    if bucket_node.value.entries.is_empty():
+      self.buckets.remove(bucket_node)
+    return entry
+
+  def evict(self):
+    entry = self.unlink(self.buckets.head_node.value.entries.head_node)
+    del self.entries[entry.key]
+    self.weight -= entry.weight
+    self.evictions += 1
+
+  def clear(self):
+    self.entries = {}
+    self.buckets = DoublyLinkedList()
+    self.weight = 0
+
+# The protected segment may hold up to protected_ratio of max_size entries (or of max_weight).
+# When promoting an entry overfills it, its least recently used entries are demoted back to the most recently used end of probation.
+# Evictions come from the least recently used end of probation, and from protected only once probation is empty.
+
+PROBATION = 0
+PROTECTED = 1
+
+class SegmentedLRUCache(Cache):
+  def __init__(self, max_size=128, max_weight=None, weigher=None, protected_ratio=0.8):
+    super().__init__(max_size, max_weight, weigher)
+    self.protected_ratio = protected_ratio
+    self.probation = DoublyLinkedList()
+    self.protected = DoublyLinkedList()
+    self.protected_weight = 0
+
+  def get(self, key, default=None):
+    node = self.entries.get(key)
+    if node is None:
+      self.misses += 1
+      return default
+    self.hits += 1
+    if node.value.location == PROTECTED:
+      self.protected.move_to_end(node)
+    else:
+      self.promote(node)
+    return node.value.value
+
+  def put(self, key, value):
+    weight = self.weigh(key, value)
+    node = self.entries.get(key)
+    if not self.fits(weight):
+      if node is not None:
+        self.remove(key)
+      return
+    if node is None:
+      self.entries[key] = self.probation.insert_end(CacheEntry(key, value, weight, PROBATION))
+      self.weight += weight
+    else:
+      entry = node.value
+      self.weight += weight - entry.weight
+      if entry.location == PROTECTED:
+        self.protected_weight += weight - entry.weight
+      entry.value = value
+      entry.weight = weight
+      if entry.location == PROTECTED:
+        self.protected.move_to_end(node)
+        self.demote_overflow()
+      else:
+        self.promote(node)
+    while self.is_over_limit():
+      self.evict()
+
+  def promote(self, node):
+    entry = self.probation.remove(node)
+    entry.location = PROTECTED
+    self.entries[entry.key] = self.protected.insert_end(entry)
+    self.protected_weight += entry.weight
+    self.demote_overflow()
+
+  def demote_overflow(self):
+    while self.protected.get_size() > 1 and self.is_protected_full():
+      entry = self.protected.remove(self.protected.head_node)
+      self.protected_weight -= entry.weight
+      entry.location = PROBATION
+      self.entries[entry.key] = self.probation.insert_end(entry)
+
+  def is_protected_full(self):
+    if self.max_size is not None and self.protected.get_size() > self.max_size * self.protected_ratio:
+      return True
+    return self.max_weight is not None and self.protected_weight > self.max_weight * self.protected_ratio
+
+  def remove(self, key):
+    node = self.entries.pop(key, None)
+    if node is not None:
+      if node.value.location == PROTECTED:
+        entry = self.protected.remove(node)
+        self.protected_weight -= entry.weight
+      else:
+        entry = self.probation.remove(node)
+      self.weight -= entry.weight
+      return entry.value
+
+  def evict(self):
+    if self.probation.is_empty():
+      entry = self.protected.remove(self.protected.head_node)
+      self.protected_weight -= entry.weight
+    else:
+      entry = self.probation.remove(self.probation.head_node)
+    del self.entries[entry.key]
+    self.weight -= entry.weight
+    self.evictions += 1
+
+  def clear(self):
+    self.entries = {}
+    self.probation = DoublyLinkedList()
+    self.protected = DoublyLinkedList()
+    self.weight = 0
+    self.protected_weight = 0
+
+# memoize() wraps a function so its results are cached by argument. It uses an LRUCache unless another cache is passed in.
+# Arguments must be hashable. The cache is available on the wrapped function as .cache, e.g. for cache.stats().
+# Keyword arguments go into the key after KWARGS_MARK, an object no caller passes, so f(1, a=2) and f((1,), (("a", 2),)) get different keys.
+#
+# @memoize(max_size=1024)
+# def lookup(user_id):
+#   ...
+
+KWARGS_MARK = object()
+
+def memoize(cache=None, max_size=128, max_weight=None, weigher=None):
+  if cache is None:
+    cache = LRUCache(max_size, max_weight, weigher)
+
+  def decorator(function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+      key = args + (KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+      value = cache.get(key, MISSING)
+      if value is MISSING:
+        value = function(*args, **kwargs)
+        cache.put(key, value)
+      return value
+    wrapper.cache = cache
+    return wrapper
+  return decorator
@@ -0,0 +1,201 @@
+# The Queue and Stack classes change head, tail, top_item and size without any synchronization, so two threads using the same structure can corrupt it.
+# Wrapping every call in one global lock is safe, but it means a producer adding to the tail has to wait for a consumer reading from the head.
+
+# ConcurrentQueue uses the two-lock design: one lock guards the head and another guards the tail, so producers only contend with producers and consumers with consumers.
+# The trick is a dummy node at the head. The real items start at head.next_node, which means enqueue only touches the tail and dequeue only touches the head, even when the queue holds a single item.
+# The size is a single counter shared by both sides, like the atomic count in Java's LinkedBlockingQueue. Every change to it goes through
+# count_lock, a third lock held only for the read-and-update, and returns the size from just before the change.
+# Since those changes happen one at a time, exactly one producer sees the queue go from empty to one item and wakes a waiting consumer,
+# and exactly one consumer sees it go from full to one free slot and wakes a waiting producer. Two counters owned by different locks
+# could not promise that: a producer and a consumer could each read the other's counter before it changed, and then both skip the wake-up.
+
+# put() and get() block until there is room or an item, optionally giving up after timeout seconds with QueueFull or QueueEmpty.
+# Waiting threads are woken with conditions, not polling. A producer only takes the head lock (and a consumer the tail lock) when the queue was empty (or full) and someone may be waiting on the other side.
+# enqueue() and dequeue() are the non-blocking forms, so a ConcurrentQueue can be used anywhere a Queue is.
+
+import threading
+from time import monotonic
+from .node import Node
+from .exceptions import QueueFull, QueueEmpty, StackOverflow, StackUnderflow
+
+class ConcurrentQueue:
+  def __init__(self, max_size=None):
+    self.head = Node(None)
+    self.tail = self.head
+    self.max_size = max_size
+    self.count = 0
+    self.count_lock = threading.Lock()
+    self.head_lock = threading.Lock()
+    self.tail_lock = threading.Lock()
+    self.not_empty = threading.Condition(self.head_lock)
+    self.not_full = threading.Condition(self.tail_lock)
+
+  def put(self, value, block=True, timeout=None):
+    max_size = self.max_size
+    with self.tail_lock:
+      if max_size is not None and self.count >= max_size:
+        if not block:
+          raise QueueFull("Sorry, no more room!")
+        deadline = None if timeout is None else monotonic() + timeout
+        while self.count >= max_size:
+          if deadline is None:
+            self.not_full.wait()
+          else:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+              raise QueueFull("Sorry, no more room!")
+            self.not_full.wait(remaining)
+      item_to_add = Node(value)
+      self.tail.next_node = item_to_add
+      self.tail = item_to_add
+      size_before = self.change_count(1)
+      # Pass the wake-up along to the next waiting producer if there is still room
+      if max_size is not None and size_before + 1 < max_size:
+        self.not_full.notify()
+    if size_before == 0:
+      with self.head_lock:
+        self.not_empty.notify()
+
+  def get(self, block=True, timeout=None):
+    max_size = self.max_size
+    with self.head_lock:
+      if self.count <= 0:
+        if not block:
+          raise QueueEmpty("This queue is totally empty!")
+        deadline = None if timeout is None else monotonic() + timeout
+        while self.count <= 0:
+          if deadline is None:
+            self.not_empty.wait()
+          else:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+              raise QueueEmpty("This queue is totally empty!")
+            self.not_empty.wait(remaining)
+      item_to_remove = self.head.next_node
+      value = item_to_remove.value
+      # The removed node becomes the new dummy head, so drop its value
+      item_to_remove.value = None
+      self.head = item_to_remove
+      size_before = self.change_count(-1)
+      if size_before > 1:
+        self.not_empty.notify()
+    if max_size is not None and size_before >= max_size:
+      with self.tail_lock:
+        self.not_full.notify()
+    return value
+
+  def enqueue(self, value):
+    self.put(value, block=False)
+
+  def try_enqueue(self, value):
+    try:
+      self.put(value, block=False)
+    except QueueFull:
+      return False
+    return True
+
+  def dequeue(self):
+    return self.get(block=False)
+
+  def try_dequeue(self, default=None):
+    try:
+      return self.get(block=False)
+    except QueueEmpty:
+      return default
+
+  def peek(self):
+    with self.head_lock:
+      item = self.head.next_node
+      if item is None:
+        raise QueueEmpty("Nothing to see here!")
+      return item.value
+
+  # Adds change to the count and returns the count from before
+  def change_count(self, change):
+    with self.count_lock:
+      count = self.count
+      self.count = count + change
+    return count
+
+  def get_size(self):
+    return self.count
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.get_size()
+
+  def is_empty(self):
+    return self.get_size() == 0
+
+# A stack only has one end, so pushes and pops always touch the same top_item and a second lock would not help.
+# ConcurrentStack guards the Stack logic with a single lock shared by two conditions, so blocked pushers wait for room and blocked poppers wait for an item.
+# The limit works as backpressure: put() blocks while the stack is full, just like ConcurrentQueue.put().
+
+class ConcurrentStack:
+  def __init__(self, limit=1000):
+    self.top_item = None
+    self.size = 0
+    self.limit = limit
+    self.lock = threading.Lock()
+    self.not_empty = threading.Condition(self.lock)
+    self.not_full = threading.Condition(self.lock)
+
+  def put(self, value, block=True, timeout=None):
+    with self.lock:
+      if self.size >= self.limit:
+        if not block:
+          raise StackOverflow("All out of space!")
+        if not self.not_full.wait_for(self.has_space, timeout):
+          raise StackOverflow("All out of space!")
+      self.top_item = Node(value, self.top_item)
+      self.size += 1
+      self.not_empty.notify()
+
+  def get(self, block=True, timeout=None):
+    with self.lock:
+      if self.size == 0:
+        if not block:
+          raise StackUnderflow("This stack is totally empty.")
+        if not self.not_empty.wait_for(self.has_items, timeout):
+          raise StackUnderflow("This stack is totally empty.")
+      item_to_remove = self.top_item
+      self.top_item = item_to_remove.next_node
+      self.size -= 1
+      self.not_full.notify()
+      return item_to_remove.value
+
+  def push(self, value):
+    self.put(value, block=False)
+
+  def try_push(self, value):
+    try:
+      self.put(value, block=False)
+    except StackOverflow:
+      return False
+    return True
+
+  def pop(self):
+    return self.get(block=False)
+
+  def try_pop(self, default=None):
+    try:
+      return self.get(block=False)
+    except StackUnderflow:
+      return default
+
+  def peek(self):
+    with self.lock:
+      if self.top_item is None:
+        raise StackUnderflow("Nothing to see here!")
+      return self.top_item.value
+
+  def has_space(self):
+    return self.limit > self.size
+
+  def has_items(self):
+    return self.size > 0
+
+  def is_empty(self):
+    return self.size == 0
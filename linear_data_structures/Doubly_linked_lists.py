@@ -0,0 +1,154 @@
+# A doubly linked list gives every node a second link, prev_node, that points back at the node before it.
+# With links in both directions, a node can unlink itself: its neighbours are right there, so there is no need to walk the list looking for the node in front of it.
+# The list also keeps a tail_node next to its head_node, so adding at either end is O(1).
+
+# The insert methods return the node they created. That node works as a handle: hold on to it and you can later
+# remove it, or insert right after it, in O(1) no matter where it sits in the list.
+# This is the building block for structures such as LRU caches and schedulers, where entries are constantly removed from the middle.
+
+# The list keeps track of its own length, so get_size() does not have to count the nodes.
+# Iteration runs from head to tail and reversed() runs from tail to head.
+
+from .node import Node
+from .iteration import IterableMixin
+
+class DoublyNode(Node):
+  __slots__ = ("prev_node",)
+
+  def __init__(self, value, next_node=None, prev_node=None):
+    self.value = value
+    self.next_node = next_node
+    self.prev_node = prev_node
+
+  def get_prev_node(self):
+    return self.prev_node
+
+  def set_prev_node(self, prev_node):
+    self.prev_node = prev_node
+
+class DoublyLinkedList(IterableMixin):
+  def __init__(self):
+    self.head_node = None
+    self.tail_node = None
+    self.size = 0
+
+  def get_head_node(self):
+    return self.head_node
+
+  def get_tail_node(self):
+    return self.tail_node
+
+  def insert_beginning(self, new_value):
+    new_node = DoublyNode(new_value, self.head_node)
+    if self.head_node is None:
+      self.tail_node = new_node
+    else:
+      self.head_node.prev_node = new_node
+    self.head_node = new_node
+    self.size += 1
+    return new_node
+
+  def insert_end(self, new_value):
+    new_node = DoublyNode(new_value, None, self.tail_node)
+    if self.tail_node is None:
+      self.head_node = new_node
+    else:
+      self.tail_node.next_node = new_node
+    self.tail_node = new_node
+    self.size += 1
+    return new_node
+
+  def insert_after(self, node, new_value):
+    next_node = node.next_node
+    new_node = DoublyNode(new_value, next_node, node)
+    node.next_node = new_node
+    if next_node is None:
+      self.tail_node = new_node
+    else:
+      next_node.prev_node = new_node
+    self.size += 1
+    return new_node
+
+  def insert_before(self, node, new_value):
+    prev_node = node.prev_node
+    new_node = DoublyNode(new_value, node, prev_node)
+    node.prev_node = new_node
+    if prev_node is None:
+      self.head_node = new_node
+    else:
+      prev_node.next_node = new_node
+    self.size += 1
+    return new_node
+
+  # Unlinks a node handle returned by one of the insert methods and returns its value.
+  # The handle must belong to this list; removing the same handle twice corrupts the list.
+  def remove(self, node):
+    prev_node = node.prev_node
+    next_node = node.next_node
+    if prev_node is None:
+      self.head_node = next_node
+    else:
+      prev_node.next_node = next_node
+    if next_node is None:
+      self.tail_node = prev_node
+    else:
+      next_node.prev_node = prev_node
+    node.prev_node = None
+    node.next_node = None
+    self.size -= 1
+    return node.value
+
+  # Moves an existing node to the front or the back without creating a new one, which is what an LRU cache does on every hit
+  def move_to_beginning(self, node):
+    if node is not self.head_node:
+      self.remove(node)
+      node.next_node = self.head_node
+      self.head_node.prev_node = node
+      self.head_node = node
+      self.size += 1
+
+  def move_to_end(self, node):
+    if node is not self.tail_node:
+      self.remove(node)
+      node.prev_node = self.tail_node
+      self.tail_node.next_node = node
+      self.tail_node = node
+      self.size += 1
+
+  # Finding a node by value still needs a walk; the handles are what make removal O(1)
+  def find(self, value):
+    current_node = self.head_node
+    while current_node is not None:
+      if current_node.value == value:
+        return current_node
+      current_node = current_node.next_node
+    return None
+
+  def remove_node(self, value_to_remove):
+    node = self.find(value_to_remove)
+    if node is not None:
+      self.remove(node)
+
+  def get_size(self):
+    return self.size
+
+  def is_empty(self):
+    return self.size == 0
+
+  def __iter__(self):
+    current_node = self.head_node
+    while current_node is not None:
+      yield current_node.value
+      current_node = current_node.next_node
+
+  def __reversed__(self):
+    current_node = self.tail_node
+    while current_node is not None:
+      yield current_node.value
+      current_node = current_node.prev_node
+
+  def __len__(self):
+    return self.size
+
+  def stringify_list(self):
+    return "".join([str(value) + "\n" for value in self if value is not None])
@@ -0,0 +1,144 @@
+# Copying a Stack or a LinkedList to get a snapshot of it means copying every node, so the snapshot costs O(n) time and memory.
+# The immutable versions here never change once they are built. push(), pop() and insert_beginning() leave the version they are called on
+# alone and return a new version instead, and the new version shares every node it can with the old one.
+
+# A singly linked chain makes the sharing easy. Pushing onto a stack only needs one new node that links to the old top,
+# so both versions see the same nodes below it. Popping only needs a version that starts at the node under the top,
+# so nothing is copied at all. Holding on to a version is therefore a snapshot that costs O(1) time and memory.
+
+# Nodes are never changed after they are built, so any number of threads can read any version without a lock,
+# while other threads go on making new versions from it. Publishing a new version is a single attribute assignment.
+# The nodes are ordinary Nodes (see node.py). Changing them through get_head_node() breaks every version that shares them, so don't.
+
+# Removing a value from the middle of an ImmutableLinkedList copies the nodes in front of it and shares everything behind it,
+# so it costs O(k) for a value k nodes from the head, the same walk a LinkedList does to find it.
+# Unlike LinkedList there is no placeholder head node: ImmutableLinkedList() is empty and every value inserted counts, None included.
+
+# A Stack that doesn't recycle its nodes through a NodePool never changes a node either, so Stack.snapshot() hands out an ImmutableStack
+# that shares the stack's nodes in O(1). With a NodePool the popped nodes get reused, so the snapshot has to copy them instead.
+
+from .node import Node
+from .exceptions import StackOverflow, StackUnderflow
+from .iteration import IterableMixin
+
+class ImmutableStack(IterableMixin):
+  __slots__ = ("top_item", "size", "limit")
+
+  def __init__(self, limit=1000, top_item=None, size=0):
+    self.top_item = top_item
+    self.size = size
+    self.limit = limit
+
+  def push(self, value):
+    if self.size >= self.limit:
+      raise StackOverflow("All out of space!")
+    return ImmutableStack(self.limit, Node(value, self.top_item), self.size + 1)
+
+  # Pushes the values in order, so the last one ends up on top. Like push(), it raises StackOverflow if they don't all fit,
+  # and since this version is never changed, nothing is pushed at all in that case
+  def push_many(self, values):
+    top = self.top_item
+    room = self.limit - self.size
+    count = 0
+    for value in values:
+      if count >= room:
+        raise StackOverflow("All out of space!")
+      top = Node(value, top)
+      count += 1
+    return ImmutableStack(self.limit, top, self.size + count)
+
+  def pop(self):
+    if self.is_empty():
+      raise StackUnderflow("This stack is totally empty.")
+    return ImmutableStack(self.limit, self.top_item.next_node, self.size - 1)
+
+  # Drops up to count items from the top (all of them when count is None)
+  def pop_many(self, count=None):
+    if count is None or count > self.size:
+      count = self.size
+    count = max(count, 0)
+    item = self.top_item
+    for _ in range(count):
+      item = item.next_node
+    return ImmutableStack(self.limit, item, self.size - count)
+
+  def peek(self):
+    if self.is_empty():
+      raise StackUnderflow("Nothing to see here!")
+    return self.top_item.value
+
+  def get_size(self):
+    return self.size
+
+  def has_space(self):
+    return self.limit > self.size
+
+  def is_empty(self):
+    return self.size == 0
+
+  def __iter__(self):
+    item = self.top_item
+    while item is not None:
+      yield item.value
+      item = item.next_node
+
+  def __len__(self):
+    return self.size
+
+class ImmutableLinkedList(IterableMixin):
+  __slots__ = ("head_node", "size")
+
+  def __init__(self, value=None, head_node=None, size=0):
+    if value is not None:
+      head_node = Node(value, head_node)
+      size += 1
+    self.head_node = head_node
+    self.size = size
+
+  def get_head_node(self):
+    return self.head_node
+
+  def insert_beginning(self, new_value):
+    return ImmutableLinkedList(None, Node(new_value, self.head_node), self.size + 1)
+
+  def __iter__(self):
+    current_node = self.head_node
+    while current_node is not None:
+      yield current_node.value
+      current_node = current_node.next_node
+
+  def __len__(self):
+    return self.size
+
+  def get_size(self):
+    return self.size
+
+  def stringify_list(self):
+    return "".join([str(value) + "\n" for value in self])
+
+  # Returns the node nearest the head that holds value, or None
+  def find(self, value):
+    current_node = self.head_node
+    while current_node is not None:
+      if current_node.value == value:
+        return current_node
+      current_node = current_node.next_node
+    return None
+
+  def contains(self, value):
+    return self.find(value) is not None
+
+  # Returns a version without the node nearest the head that holds value_to_remove, or this version when there is none.
+  # The nodes in front of the removed one are copied and the rest of the chain is shared.
+  def remove_node(self, value_to_remove):
+    prefix = []
+    current_node = self.head_node
+    while current_node is not None and current_node.value != value_to_remove:
+      prefix.append(current_node.value)
+      current_node = current_node.next_node
+    if current_node is None:
+      return self
+    head_node = current_node.next_node
+    for value in reversed(prefix):
+      head_node = Node(value, head_node)
+    return ImmutableLinkedList(None, head_node, self.size - 1)
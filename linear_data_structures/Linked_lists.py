@@ -33,22 +33,7 @@
 # Remember that a node contains two elements: 1. data 2. a link to the next node
 # Note: Because the workspace is set up with spaces instead of tabs, you will need to use spaces to prevent Python from throwing an error. 
 
-class Node:
-  def __init__(self, value, next_node=None):
-    self.value = value
-    self.next_node = next_node
-    
-  def get_value(self):
-    return self.value
-  
-  def get_next_node(self):
-    return self.next_node
-  
-  def set_next_node(self, next_node):
-    self.next_node = next_node
-    
-my_node = Node(44)
-print(my_node.get_value())
+# The finished Node lives in node.py, where it is shared by LinkedList, Queue and Stack.
 
 # With the Node in hand, we can start building the actual linked list. Depending on the end-use of the linked list, a variety of methods can be defined.
 # For our use, we want to be able to:
@@ -57,13 +42,6 @@ print(my_node.get_value())
 # print out the list values in order
 # remove a node that has a particular value
 
-class LinkedList:
-  def __init__(self, value=None):
-    self.head_node = Node(value)
-  
-  def get_head_node(self):
-    return self.head_node
-   
 # Next up, we’ll define methods for our LinkedList class that allow us to:
 # insert a new head node
 # return all the nodes in the list as a string so we can print them out in the terminal!
@@ -72,53 +50,6 @@ class LinkedList:
 # insert a new head node
 # return all the nodes in the list as a string so we can print them out in the terminal!
 
-# We'll be using our Node class
-class Node:
-  def __init__(self, value, next_node=None):
-    self.value = value
-    self.next_node = next_node
-    
-  def get_value(self):
-    return self.value
-  
-  def get_next_node(self):
-    return self.next_node
-  
-  def set_next_node(self, next_node):
-    self.next_node = next_node
-
-# Our LinkedList class
-class LinkedList:
-  def __init__(self, value=None):
-    self.head_node = Node(value)
-  
-  def get_head_node(self):
-    return self.head_node
-  
-# Add your insert_beginning and stringify_list methods below:
-
-  def insert_beginning(self, new_value):
-    new_node = Node(new_value)
-    new_node.set_next_node(self.head_node)
-    self.head_node = new_node
-    
-  def stringify_list(self):
-    string_list = ""
-    current_node = self.get_head_node()
-    while current_node:
-      if current_node.get_value() != None:
-        string_list += str(current_node.get_value()) + "\n"
-      current_node = current_node.get_next_node()
-    return string_list
-  
-
-# Test your code by uncommenting the statements below - did your list print to the terminal?
-ll = LinkedList(5)
-ll.insert_beginning(70)
-ll.insert_beginning(5675)
-ll.insert_beginning(90)
-print(ll.stringify_list())
-
 # The final use case we mentioned was the ability to remove an arbitrary node with a particular value. This is slightly more complex, since a couple of special cases need to be handled.
 # Consider the following list:
 # a -> b -> c
@@ -128,52 +59,140 @@ print(ll.stringify_list())
 # Lucky for us, in Python, nodes which are not referenced will be removed for us automatically. 
 # If we take care of the references, b will be “removed” for us in a process called Garbage Collection.
 
-class Node:
-  def __init__(self, value, next_node=None):
-    self.value = value
-    self.next_node = next_node
-    
-  def get_value(self):
-    return self.value
-  
-  def get_next_node(self):
-    return self.next_node
-  
-  def set_next_node(self, next_node):
-    self.next_node = next_node
+# An optional NodePool (see node.py) can be passed in as node_pool. Removed nodes are then given back to the pool and new ones are taken from it.
+
+# Finding a value means walking the list from the head, so removing by value over and over gets slow quickly.
+# Passing indexed=True makes the list keep two dictionaries up to date as nodes come and go:
+# index maps each value to the nodes holding it, and previous maps each node to the node in front of it (None for the head).
+# find(), contains() and remove_node() then look the value up instead of walking, and the node in front is right there for the unlinking, so all three are O(1) on average.
+# Values that appear more than once get one entry per node. New nodes only ever go in at the beginning,
+# so the last node in a value's entry is always the one nearest the head, which is the one remove_node() removes.
+# An indexed list needs hashable values and costs two dictionary entries per node.
+
+# Iterating over the list yields its values from the head, skipping None values the same way stringify_list() does,
+# and len() counts those same values. The list keeps the count as it changes, so len() does not walk the list.
+
+# Like the Queue and Stack, the list calls event_hook(linked_list, event, value) when a hook is set, with the events "insert" and "remove".
+from .node import Node
+from .iteration import IterableMixin
 
 # Our LinkedList class
-class LinkedList:
-  def __init__(self, value=None):
-    self.head_node = Node(value)
+class LinkedList(IterableMixin):
+  def __init__(self, value=None, node_pool=None, indexed=False):
+    self.node_pool = node_pool
+    self.head_node = self.new_node(value)
+    self.size = 0 if value is None else 1
+    self.event_hook = None
+    self.indexed = indexed
+    if indexed:
+      self.index = {value: [self.head_node]}
+      self.previous = {self.head_node: None}
   
   def get_head_node(self):
     return self.head_node
   
   def insert_beginning(self, new_value):
-    new_node = Node(new_value)
+    new_node = self.new_node(new_value)
     new_node.set_next_node(self.head_node)
+    if self.indexed:
+      self.previous[new_node] = None
+      if self.head_node is not None:
+        self.previous[self.head_node] = new_node
+      self.index.setdefault(new_value, []).append(new_node)
     self.head_node = new_node
+    if new_value is not None:
+      self.size += 1
+    if self.event_hook is not None:
+      self.event_hook(self, "insert", new_value)
+
+  def __iter__(self):
+    current_node = self.head_node
+    while current_node is not None:
+      value = current_node.value
+      if value is not None:
+        yield value
+      current_node = current_node.next_node
+
+  def __len__(self):
+    return self.size
+
+  def get_size(self):
+    return self.size
     
+  # Adding to a string with += copies the whole string each time, which makes the loop quadratic; joining the pieces once is linear
   def stringify_list(self):
-    string_list = ""
+    return "".join([str(value) + "\n" for value in self])
+  
+  # Returns the node nearest the head that holds value, or None
+  def find(self, value):
+    if self.indexed:
+      nodes = self.index.get(value)
+      return nodes[-1] if nodes else None
     current_node = self.get_head_node()
     while current_node:
-      if current_node.get_value() != None:
-        string_list += str(current_node.get_value()) + "\n"
+      if current_node.get_value() == value:
+        return current_node
       current_node = current_node.get_next_node()
-    return string_list
-  
+    return None
+
+  def contains(self, value):
+    return self.find(value) is not None
+
   # Define your remove_node method below:
   def remove_node(self, value_to_remove):
+    if self.indexed:
+      self.remove_indexed_node(value_to_remove)
+      return
+    # A value that isn't in the list is ignored, the same as on an indexed list
     current_node = self.get_head_node()
+    if current_node is None:
+      return
     if current_node.get_value() == value_to_remove:
       self.head_node = current_node.get_next_node()
+      self.node_removed(current_node)
     else:
       while current_node:
         next_node = current_node.get_next_node()
+        if next_node is None:
+          return
         if next_node.get_value() == value_to_remove:
           current_node.set_next_node(next_node.get_next_node())
+          self.node_removed(next_node)
           current_node = None
         else:
           current_node = next_node
+
+  def remove_indexed_node(self, value_to_remove):
+    nodes = self.index.get(value_to_remove)
+    if not nodes:
+      return
+    node = nodes.pop()
+    if not nodes:
+      del self.index[value_to_remove]
+    prev_node = self.previous.pop(node)
+    next_node = node.get_next_node()
+    if prev_node is None:
+      self.head_node = next_node
+    else:
+      prev_node.set_next_node(next_node)
+    if next_node is not None:
+      self.previous[next_node] = prev_node
+    self.node_removed(node)
+
+  # Bookkeeping for a node that has just been unlinked
+  def node_removed(self, node):
+    value = node.get_value()
+    if value is not None:
+      self.size -= 1
+    self.release_node(node)
+    if self.event_hook is not None:
+      self.event_hook(self, "remove", value)
+
+  def new_node(self, value):
+    if self.node_pool is None:
+      return Node(value)
+    return self.node_pool.acquire(value)
+
+  def release_node(self, node):
+    if self.node_pool is not None:
+      self.node_pool.release(node)
@@ -0,0 +1,163 @@
+# Finding the smallest or largest item in a Stack or Queue normally means looking at every item in it.
+# The structures here keep a little extra bookkeeping as items come and go so that those questions are answered in O(1).
+
+# MinMaxStack is a Stack that keeps two more stacks on the side: one of minimums and one of maximums.
+# A pushed value goes onto the minimum stack when it is less than or equal to the current minimum, so the top of that stack is always the smallest value on the main stack.
+# When the popped value equals the top of the minimum stack, that entry is popped as well. The maximum stack works the same way in the other direction.
+
+from collections import deque
+from itertools import chain
+from math import fsum
+from .Stacks import Stack
+from .Ring_buffer_queues import RingBufferQueue
+from .exceptions import StackUnderflow, QueueEmpty
+
+class MinMaxStack(Stack):
+  def __init__(self, limit=1000, node_pool=None):
+    super().__init__(limit, node_pool)
+    self.minimums = Stack(limit)
+    self.maximums = Stack(limit)
+
+  def push(self, value):
+    super().push(value)
+    if self.minimums.is_empty() or value <= self.minimums.peek():
+      self.minimums.push(value)
+    if self.maximums.is_empty() or value >= self.maximums.peek():
+      self.maximums.push(value)
+
+  def pop(self):
+    value = super().pop()
+    if value == self.minimums.peek():
+      self.minimums.pop()
+    if value == self.maximums.peek():
+      self.maximums.pop()
+    return value
+
+  # The batch methods go through push() and pop() so the minimum and maximum stacks stay in step
+  def push_many(self, values):
+    count = 0
+    for value in values:
+      if not self.has_space():
+        break
+      self.push(value)
+      count += 1
+    return count
+
+  def pop_many(self, count=None):
+    if count is None or count > self.size:
+      count = self.size
+    return [self.pop() for _ in range(max(count, 0))]
+
+  def get_min(self):
+    if self.is_empty():
+      raise StackUnderflow("Nothing to see here!")
+    return self.minimums.peek()
+
+  def get_max(self):
+    if self.is_empty():
+      raise StackUnderflow("Nothing to see here!")
+    return self.maximums.peek()
+
+# SlidingWindow keeps the last window_size values of a stream in a RingBufferQueue. Adding a value to a full window expires the oldest one.
+# Next to the window it keeps two monotonic deques. The minimum deque holds the values that could still become the window minimum, in increasing order:
+# a new value first removes every value at the back that is larger than it (those can never be the minimum again while the new value is in the window),
+# and the front of the deque is always the current minimum. When the expiring value is the front of the deque, it is removed from there too.
+# Every value enters and leaves each deque at most once, so keeping them up to date costs amortized O(1) per value.
+# The maximum deque works the same way, and a running total gives the sum and the mean.
+# Adding and subtracting floats one by one loses the small values next to large ones (a window of 2 fed 1e16, 1.0, 1.0 would sum to 1.0),
+# so the total is kept as a compensated (Neumaier) sum: compensation collects the low-order bits that each addition rounds away.
+# Rounding errors from values that have since expired can still build up in a long stream, so once every window_size values a float total
+# is recomputed with math.fsum() over the window, keeping what the rounded total leaves out as the new compensation, which keeps the cost amortized O(1). Integer totals are exact and left alone.
+
+class SlidingWindow:
+  def __init__(self, window_size):
+    if window_size < 1:
+      raise ValueError("window_size must be at least 1")
+    self.window_size = window_size
+    self.window = RingBufferQueue(max_size=window_size)
+    self.minimums = deque()
+    self.maximums = deque()
+    self.total = 0
+    self.compensation = 0
+    self.since_resync = 0
+
+  # Adds a value and returns the value that expired to make room for it, or None
+  def enqueue(self, value):
+    expired = None
+    if not self.window.has_space():
+      expired = self.dequeue()
+    self.window.enqueue(value)
+    minimums = self.minimums
+    while minimums and minimums[-1] > value:
+      minimums.pop()
+    minimums.append(value)
+    maximums = self.maximums
+    while maximums and maximums[-1] < value:
+      maximums.pop()
+    maximums.append(value)
+    self.add_to_total(value)
+    self.since_resync += 1
+    if self.since_resync >= self.window_size:
+      self.since_resync = 0
+      if isinstance(self.total, float):
+        self.total = fsum(self.window)
+        self.compensation = fsum(chain(self.window, (-self.total,)))
+    return expired
+
+  def enqueue_many(self, values):
+    count = 0
+    for value in values:
+      self.enqueue(value)
+      count += 1
+    return count
+
+  # Expires the oldest value early and returns it
+  def dequeue(self):
+    value = self.window.dequeue()
+    if self.minimums[0] == value:
+      self.minimums.popleft()
+    if self.maximums[0] == value:
+      self.maximums.popleft()
+    self.add_to_total(-value)
+    return value
+
+  def add_to_total(self, value):
+    total = self.total + value
+    if abs(self.total) >= abs(value):
+      self.compensation += (self.total - total) + value
+    else:
+      self.compensation += (value - total) + self.total
+    self.total = total
+
+  def peek(self):
+    return self.window.peek()
+
+  def get_min(self):
+    if self.window.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    return self.minimums[0]
+
+  def get_max(self):
+    if self.window.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    return self.maximums[0]
+
+  def get_sum(self):
+    return self.total + self.compensation
+
+  def get_mean(self):
+    if self.window.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    return self.get_sum() / self.window.get_size()
+
+  def get_size(self):
+    return self.window.get_size()
+
+  def __len__(self):
+    return self.window.get_size()
+
+  def is_empty(self):
+    return self.window.is_empty()
+
+  def __iter__(self):
+    return iter(self.window)
@@ -10,26 +10,14 @@
 # Begin by creating a new class, Node. Add an .__init__() method in the Node class that takes a value and an optional link_node (default should be None). 
 # These should be saved to the corresponding self properties (self.value and self.link_node).
 
-class Node:
-  def __init__(self, value, link_node=None):
-    self.value = value
-    self.link_node = link_node
- 
 # We need methods to access the data and link within the node. For this, we will use two getters, .get_value() and .get_link_node().
 # These should each return their corresponding value on the self object.
 
-  # Define your get_value and get_link_node methods below:
-  def get_value(self):
-    return self.value
-  
-  def get_link_node(self):
-    return self.link_node
- 
 # We are only allowing the value of the node to be set upon creation. 
 # However, we want to allow updating the link of the node. For this, we will use a setter to modify the self.link_node attribute.
 # The method should be called .set_link_node() and should take link_node as an argument. It should then update the self.link_node attribute as appropriate.
 
-  # Define your set_link_node method below:
-  def set_link_node(self, link_node):
-    self.link_node = link_node
+# The finished Node is shared by every structure in the project, so it lives in node.py.
+# It stores its link as next_node and uses __slots__ to stay small; link_node, get_link_node() and set_link_node() work as described above.
+from .node import Node
  
@@ -0,0 +1,288 @@
+# When every item is a plain int or float, wrapping each one in a Python object and a Node costs far more memory than the number itself.
+# NumericStack and NumericQueue store their items unboxed in a typed array.array instead, e.g. 8 bytes per float ("d") or per 64 bit int ("q").
+# typecode is any array module type code; when NumPy is installed a NumPy dtype works too.
+
+# The batch methods take any buffer (array.array, bytes-like objects, NumPy arrays) and copy it in with a single slice assignment
+# when its element type and byte order match; other iterables, and buffers in the other byte order, are converted first. Like the Node based batch methods, they return how many items were accepted.
+# The removing batch methods and contents() hand back a view of the array instead of a copy: a NumPy array when NumPy is installed,
+# a memoryview otherwise. A view is only valid until the next change to the structure, because new items may be written over it.
+
+# sum(), min() and max() run over the stored items without removing them; with NumPy installed they are vectorized.
+
+# The stack is one array filled from index 0 up. The queue keeps its items between head and tail in one array:
+# enqueue writes at the tail and dequeue moves the head forward. When the tail reaches the end, the items are moved back to the start,
+# or the array is doubled if it is more than half full, so the items are always in one contiguous run and a batch can always be returned as one view.
+
+import struct
+import sys
+from array import array
+from .exceptions import QueueFull, QueueEmpty, StackOverflow, StackUnderflow
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+SIGNED = "bhilq"
+UNSIGNED = "BHILQ"
+FLOATS = "fd"
+NATIVE_ORDERS = ("", "@", "=", "<" if sys.byteorder == "little" else ">")
+
+def resolve_typecode(typecode):
+  if isinstance(typecode, str) and len(typecode) == 1:
+    return typecode
+  if numpy is not None:
+    return numpy.dtype(typecode).char
+  raise TypeError("unsupported typecode {!r}".format(typecode))
+
+def kind(format_code):
+  for kind_codes in (SIGNED, UNSIGNED, FLOATS):
+    if format_code in kind_codes:
+      return kind_codes
+  return None
+
+class NumericStorage:
+  def __init__(self, typecode, capacity):
+    self.typecode = resolve_typecode(typecode)
+    self.itemsize = array(self.typecode).itemsize
+    self.items = self.allocate(max(capacity, 1))
+
+  def allocate(self, capacity):
+    return array(self.typecode, bytes(capacity * self.itemsize))
+
+  # Returns values as an array or memoryview with this structure's typecode, copying only when the element type does not match
+  def coerce(self, values):
+    try:
+      view = memoryview(values)
+    except TypeError:
+      return array(self.typecode, values)
+    format_code = view.format.lstrip("@=<>!")
+    byte_order = view.format[:len(view.format) - len(format_code)]
+    if (view.ndim == 1 and view.c_contiguous and view.itemsize == self.itemsize and byte_order in NATIVE_ORDERS
+        and kind(format_code) == kind(self.typecode)):
+      return view.cast("B").cast(self.typecode)
+    try:
+      return array(self.typecode, view.tolist())
+    except NotImplementedError:
+      # memoryview can't read formats with a non-native byte order, but struct can
+      return array(self.typecode, [item[0] for item in struct.iter_unpack(view.format, view.tobytes())])
+
+  def wrap(self, start, stop):
+    view = memoryview(self.items)[start:stop]
+    if numpy is not None:
+      return numpy.frombuffer(view, dtype=self.typecode)
+    return view
+
+  def aggregate(self, function, start, stop):
+    if numpy is not None:
+      return getattr(numpy, function)(numpy.frombuffer(self.items, dtype=self.typecode, count=stop - start, offset=start * self.itemsize))
+    return {"sum": sum, "min": min, "max": max}[function](memoryview(self.items)[start:stop])
+
+class NumericStack(NumericStorage):
+  def __init__(self, limit=1000, typecode="d", initial_capacity=1024):
+    super().__init__(typecode, min(limit, initial_capacity))
+    self.limit = limit
+    self.size = 0
+
+  def push(self, value):
+    if not self.has_space():
+      raise StackOverflow("All out of space!")
+    if self.size == len(self.items):
+      self.grow(self.size + 1)
+    self.items[self.size] = value
+    self.size += 1
+
+  def try_push(self, value):
+    try:
+      self.push(value)
+    except StackOverflow:
+      return False
+    return True
+
+  def pop(self):
+    if self.is_empty():
+      raise StackUnderflow("This stack is totally empty.")
+    self.size -= 1
+    return self.items[self.size]
+
+  def try_pop(self, default=None):
+    if self.is_empty():
+      return default
+    return self.pop()
+
+  def peek(self):
+    if self.is_empty():
+      raise StackUnderflow("Nothing to see here!")
+    return self.items[self.size - 1]
+
+  def push_many(self, values):
+    values = self.coerce(values)
+    count = min(len(values), max(self.limit - self.size, 0))
+    if self.size + count > len(self.items):
+      self.grow(self.size + count)
+    memoryview(self.items)[self.size:self.size + count] = memoryview(values)[:count]
+    self.size += count
+    return count
+
+  # Pops up to count items (all of them when count is None) and returns them as a view, top first
+  def pop_many(self, count=None):
+    if count is None or count > self.size:
+      count = self.size
+    count = max(count, 0)
+    self.size -= count
+    return self.wrap(self.size, self.size + count)[::-1]
+
+  # A view of everything on the stack, from the bottom up
+  def contents(self):
+    return self.wrap(0, self.size)
+
+  def sum(self):
+    return self.aggregate("sum", 0, self.size)
+
+  def min(self):
+    if self.is_empty():
+      raise StackUnderflow("Nothing to see here!")
+    return self.aggregate("min", 0, self.size)
+
+  def max(self):
+    if self.is_empty():
+      raise StackUnderflow("Nothing to see here!")
+    return self.aggregate("max", 0, self.size)
+
+  def grow(self, needed):
+    capacity = len(self.items)
+    while capacity < needed:
+      capacity *= 2
+    items = self.allocate(min(capacity, max(self.limit, needed)))
+    memoryview(items)[:self.size] = memoryview(self.items)[:self.size]
+    self.items = items
+
+  def get_size(self):
+    return self.size
+
+  def __len__(self):
+    return self.size
+
+  def has_space(self):
+    return self.limit > self.size
+
+  def is_empty(self):
+    return self.size == 0
+
+  def __iter__(self):
+    return reversed(self.items[:self.size])
+
+class NumericQueue(NumericStorage):
+  def __init__(self, max_size=None, typecode="d", initial_capacity=1024):
+    super().__init__(typecode, initial_capacity if max_size is None else min(max_size, initial_capacity))
+    self.max_size = max_size
+    self.head = 0
+    self.tail = 0
+
+  def enqueue(self, value):
+    if not self.has_space():
+      raise QueueFull("Sorry, no more room!")
+    if self.tail == len(self.items):
+      self.make_room(1)
+    self.items[self.tail] = value
+    self.tail += 1
+
+  def try_enqueue(self, value):
+    try:
+      self.enqueue(value)
+    except QueueFull:
+      return False
+    return True
+
+  def dequeue(self):
+    if self.is_empty():
+      raise QueueEmpty("This queue is totally empty!")
+    value = self.items[self.head]
+    self.head += 1
+    if self.head == self.tail:
+      self.head = 0
+      self.tail = 0
+    return value
+
+  def try_dequeue(self, default=None):
+    if self.is_empty():
+      return default
+    return self.dequeue()
+
+  def peek(self):
+    if self.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    return self.items[self.head]
+
+  def enqueue_many(self, values):
+    values = self.coerce(values)
+    count = len(values)
+    if self.max_size is not None:
+      count = min(count, max(self.max_size - self.get_size(), 0))
+    if self.tail + count > len(self.items):
+      self.make_room(count)
+    memoryview(self.items)[self.tail:self.tail + count] = memoryview(values)[:count]
+    self.tail += count
+    return count
+
+  # Removes up to count items (all of them when count is None) and returns them as a view, head first
+  def dequeue_many(self, count=None):
+    size = self.get_size()
+    if count is None or count > size:
+      count = size
+    count = max(count, 0)
+    start = self.head
+    self.head += count
+    view = self.wrap(start, start + count)
+    if self.head == self.tail:
+      self.head = 0
+      self.tail = 0
+    return view
+
+  # A view of everything in the queue, from head to tail
+  def contents(self):
+    return self.wrap(self.head, self.tail)
+
+  def sum(self):
+    return self.aggregate("sum", self.head, self.tail)
+
+  def min(self):
+    if self.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    return self.aggregate("min", self.head, self.tail)
+
+  def max(self):
+    if self.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    return self.aggregate("max", self.head, self.tail)
+
+  # Makes room for count more items at the tail by moving the items back to the start, doubling the array if needed.
+  # The items go into a new array, because array slices cannot be moved in place while views of them exist.
+  def make_room(self, count):
+    size = self.get_size()
+    capacity = len(self.items)
+    while size + count > capacity or size > capacity // 2:
+      capacity *= 2
+    items = self.allocate(capacity)
+    memoryview(items)[:size] = memoryview(self.items)[self.head:self.tail]
+    self.items = items
+    self.head = 0
+    self.tail = size
+
+  def get_size(self):
+    return self.tail - self.head
+
+  def __len__(self):
+    return self.get_size()
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.get_size()
+
+  def is_empty(self):
+    return self.tail == self.head
+
+  def __iter__(self):
+    return iter(self.items[self.head:self.tail])
@@ -0,0 +1,346 @@
+# A Queue lives in memory, so a backlog can never grow past RAM and a restart loses everything in it.
+# PersistentQueue keeps the same enqueue/dequeue/peek API but stores its items in files on local disk.
+
+# The items are appended to segment files. Each segment is created at segment_size bytes and mapped into memory with mmap,
+# so writing a record is a memory copy and the operating system pages the data in and out as needed.
+# Every record is length prefixed: an 8 byte header holding the payload length plus one and a CRC32 of the payload, followed by the payload.
+# A header of zeros marks the end of the records in a segment (new segment files are all zeros).
+# When a record does not fit in the rest of the current segment, the queue rolls over to a new segment.
+# Once the head has moved past the end of a segment, nothing in it is needed any more, so the segment is deleted (compacted).
+
+# The position of the head is stored in a small checkpoint file, which has two slots that are written in turn,
+# each with a sequence number and a CRC, so a crash in the middle of writing one slot still leaves the other one intact.
+
+# Writes reach the disk when they are flushed. fsync_every sets how many operations may go by between flushes
+# (1 flushes after every operation, None leaves it to the operating system). fsync_interval flushes when an operation finds that more than
+# that many seconds have passed since the last flush. It is only checked when an operation runs, so writes to a queue that has gone idle
+# stay unflushed until the next operation, sync() or close(); call sync() from a timer if that matters.
+# Anything that was not flushed when the machine crashed may be lost; a consumed item may come back after a crash, but an item is never half written.
+
+# On start-up the queue reads the checkpoint and walks the records from the head to count them and to find the tail.
+# A record with a bad length or CRC is a torn write from a crash, so it and everything after it in that segment are cleared.
+
+# Payloads are bytes-like objects (bytes, bytearray, memoryview). Pass serializer and deserializer (for example pickle.dumps and pickle.loads)
+# to store other values. dequeue() and peek() return a copy of the payload; dequeue_view() and peek_view() return a memoryview straight
+# into the mapped file instead, without copying. A segment that still has views pointing into it stays mapped until those views are released.
+
+# mmap and fsync only give these guarantees on a local disk; do not point the queue at a network file system.
+
+import mmap
+import os
+import struct
+import zlib
+from time import monotonic
+from collections import deque
+from .exceptions import QueueFull, QueueEmpty
+
+HEADER = struct.Struct("<II")
+CHECKPOINT = struct.Struct("<QQQI")
+SEGMENT_SUFFIX = ".seg"
+CHECKPOINT_NAME = "checkpoint"
+
+class Segment:
+  def __init__(self, directory, number, size):
+    self.number = number
+    self.path = os.path.join(directory, "{:020d}{}".format(number, SEGMENT_SUFFIX))
+    fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+      existing_size = os.fstat(fd).st_size
+      if existing_size == 0:
+        os.ftruncate(fd, size)
+      else:
+        size = existing_size
+      self.map = mmap.mmap(fd, size)
+    finally:
+      os.close(fd)
+    self.size = size
+
+  def flush(self):
+    self.map.flush()
+
+  # Unmaps and deletes the segment. Returns False if views into it are still alive, in which case it has to be retried later.
+  def retire(self):
+    try:
+      self.map.close()
+    except BufferError:
+      return False
+    try:
+      os.remove(self.path)
+    except FileNotFoundError:
+      pass
+    return True
+
+class PersistentQueue:
+  def __init__(self, directory, max_size=None, segment_size=64 * 1024 * 1024, fsync_every=1000, fsync_interval=None,
+               serializer=None, deserializer=None):
+    if segment_size <= HEADER.size:
+      raise ValueError("segment_size is too small")
+    os.makedirs(directory, exist_ok=True)
+    self.directory = directory
+    self.max_size = max_size
+    self.segment_size = segment_size
+    self.fsync_every = fsync_every
+    self.fsync_interval = fsync_interval
+    self.serializer = serializer
+    self.deserializer = deserializer
+    self.segments = deque()
+    self.retired = []
+    self.size = 0
+    self.unsynced = 0
+    self.last_sync = monotonic()
+    self.open_checkpoint()
+    self.recover()
+
+  # ---- enqueue / dequeue ----
+
+  def enqueue(self, value):
+    if not self.has_space():
+      raise QueueFull("Sorry, no more room!")
+    payload = value if self.serializer is None else self.serializer(value)
+    view = memoryview(payload)
+    if view.format != "B" or view.ndim != 1:
+      view = view.cast("B")
+    length = view.nbytes
+    record_size = HEADER.size + length
+    if record_size > self.segment_size:
+      raise ValueError("a record of {} bytes does not fit in a segment of {} bytes".format(length, self.segment_size))
+    tail = self.segments[-1]
+    if self.tail_offset + record_size > tail.size:
+      tail = self.roll_over()
+    offset = self.tail_offset
+    # The payload goes in before the header, so a record is only visible once it is complete
+    tail.map[offset + HEADER.size:offset + record_size] = view
+    HEADER.pack_into(tail.map, offset, length + 1, zlib.crc32(view))
+    self.tail_offset = offset + record_size
+    self.size += 1
+    self.after_operation()
+
+  def try_enqueue(self, value):
+    try:
+      self.enqueue(value)
+    except QueueFull:
+      return False
+    return True
+
+  def dequeue(self):
+    segment, offset, length = self.locate_head()
+    start = offset + HEADER.size
+    payload = segment.map[start:start + length]
+    self.advance_head(start + length)
+    if self.deserializer is None:
+      return payload
+    return self.deserializer(payload)
+
+  def try_dequeue(self, default=None):
+    if self.size == 0:
+      return default
+    return self.dequeue()
+
+  # Like dequeue(), but returns a memoryview into the segment file instead of a copy of the payload
+  def dequeue_view(self):
+    segment, offset, length = self.locate_head()
+    start = offset + HEADER.size
+    view = memoryview(segment.map)[start:start + length]
+    self.advance_head(start + length)
+    return view
+
+  def peek(self):
+    segment, offset, length = self.locate_head(empty_message="Nothing to see here!")
+    start = offset + HEADER.size
+    payload = segment.map[start:start + length]
+    if self.deserializer is None:
+      return payload
+    return self.deserializer(payload)
+
+  def peek_view(self):
+    segment, offset, length = self.locate_head(empty_message="Nothing to see here!")
+    start = offset + HEADER.size
+    return memoryview(segment.map)[start:start + length]
+
+  def get_size(self):
+    return self.size
+
+  def __len__(self):
+    return self.size
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.get_size()
+
+  def is_empty(self):
+    return self.size == 0
+
+  # ---- segments ----
+
+  # Finds the head record, stepping over the end of exhausted segments, and returns (segment, offset, payload length)
+  def locate_head(self, empty_message="This queue is totally empty!"):
+    if self.size == 0:
+      raise QueueEmpty(empty_message)
+    while True:
+      segment = self.segments[0]
+      offset = self.head_offset
+      if offset + HEADER.size <= segment.size:
+        length_plus_one = HEADER.unpack_from(segment.map, offset)[0]
+        if length_plus_one:
+          return segment, offset, length_plus_one - 1
+      self.drop_head_segment()
+
+  def advance_head(self, offset):
+    self.head_offset = offset
+    self.size -= 1
+    segment = self.segments[0]
+    if segment is not self.segments[-1] and (offset + HEADER.size > segment.size or not HEADER.unpack_from(segment.map, offset)[0]):
+      self.drop_head_segment()
+    else:
+      self.write_checkpoint()
+    self.after_operation()
+
+  # Moves the head to the start of the next segment and deletes the one it left behind
+  def drop_head_segment(self):
+    segment = self.segments.popleft()
+    self.head_offset = 0
+    self.write_checkpoint()
+    self.checkpoint.flush()
+    if self.retired:
+      self.compact()
+    if not segment.retire():
+      self.retired.append(segment)
+
+  def roll_over(self):
+    tail = self.segments[-1]
+    tail.flush()
+    segment = Segment(self.directory, tail.number + 1, self.segment_size)
+    self.segments.append(segment)
+    self.tail_offset = 0
+    sync_directory(self.directory)
+    return segment
+
+  # Deletes consumed segments that could not be unmapped earlier because views into them were still alive
+  def compact(self):
+    self.retired = [segment for segment in self.retired if not segment.retire()]
+
+  # ---- durability ----
+
+  def after_operation(self):
+    self.unsynced += 1
+    if self.fsync_every is not None and self.unsynced >= self.fsync_every:
+      self.sync()
+    elif self.fsync_interval is not None and monotonic() - self.last_sync >= self.fsync_interval:
+      self.sync()
+
+  def sync(self):
+    self.segments[-1].flush()
+    self.checkpoint.flush()
+    self.unsynced = 0
+    self.last_sync = monotonic()
+
+  # A segment that still has views from dequeue_view() or peek_view() can't be unmapped yet. It is left mapped until the last view is gone
+  # and the garbage collector unmaps it, while everything else is closed as usual. A consumed segment left behind this way is deleted
+  # the next time the queue is opened.
+  def close(self):
+    self.sync()
+    self.compact()
+    for segment in self.segments:
+      try:
+        segment.map.close()
+      except BufferError:
+        pass
+    self.checkpoint.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  # ---- checkpoint and recovery ----
+
+  def open_checkpoint(self):
+    path = os.path.join(self.directory, CHECKPOINT_NAME)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+      if os.fstat(fd).st_size < 2 * CHECKPOINT.size:
+        os.ftruncate(fd, 2 * CHECKPOINT.size)
+      self.checkpoint = mmap.mmap(fd, 2 * CHECKPOINT.size)
+    finally:
+      os.close(fd)
+    self.checkpoint_sequence = 0
+
+  def read_checkpoint(self):
+    best = None
+    for slot in range(2):
+      offset = slot * CHECKPOINT.size
+      sequence, segment_number, head_offset, crc = CHECKPOINT.unpack_from(self.checkpoint, offset)
+      if sequence and crc == zlib.crc32(self.checkpoint[offset:offset + CHECKPOINT.size - 4]):
+        if best is None or sequence > best[0]:
+          best = (sequence, segment_number, head_offset)
+    return best
+
+  def write_checkpoint(self):
+    self.checkpoint_sequence += 1
+    offset = (self.checkpoint_sequence % 2) * CHECKPOINT.size
+    body = struct.pack("<QQQ", self.checkpoint_sequence, self.segments[0].number, self.head_offset)
+    self.checkpoint[offset:offset + CHECKPOINT.size] = body + struct.pack("<I", zlib.crc32(body))
+
+  def recover(self):
+    numbers = sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(self.directory) if name.endswith(SEGMENT_SUFFIX))
+    checkpoint = self.read_checkpoint()
+    head_number, head_offset = 0, 0
+    if checkpoint is not None:
+      self.checkpoint_sequence, head_number, head_offset = checkpoint
+    for number in numbers:
+      segment = Segment(self.directory, number, self.segment_size)
+      if number < head_number:
+        # Consumed before the crash but not deleted yet
+        segment.retire()
+      else:
+        self.segments.append(segment)
+    if not self.segments:
+      self.segments.append(Segment(self.directory, head_number, self.segment_size))
+      head_offset = 0
+    elif self.segments[0].number != head_number:
+      head_offset = 0
+    self.head_offset = head_offset
+    offset = head_offset
+    for segment in self.segments:
+      offset, count = scan_segment(segment, offset)
+      self.size += count
+      self.tail_offset = offset
+      offset = 0
+    self.write_checkpoint()
+    self.sync()
+
+# Counts the valid records from offset onwards and clears anything after the last one.
+# Returns the offset just past the last valid record and the number of records.
+def scan_segment(segment, offset):
+  count = 0
+  view = memoryview(segment.map)
+  try:
+    while offset + HEADER.size <= segment.size:
+      length_plus_one, crc = HEADER.unpack_from(segment.map, offset)
+      if not length_plus_one:
+        break
+      end = offset + HEADER.size + length_plus_one - 1
+      if end > segment.size or zlib.crc32(view[offset + HEADER.size:end]) != crc:
+        segment.map[offset:] = bytes(segment.size - offset)
+        break
+      offset = end
+      count += 1
+  finally:
+    view.release()
+  return offset, count
+
+# Makes the creation of a new segment file durable. Not every platform can open a directory, so failures are ignored.
+def sync_directory(directory):
+  try:
+    fd = os.open(directory, os.O_RDONLY)
+  except OSError:
+    return
+  try:
+    os.fsync(fd)
+  except OSError:
+    pass
+  finally:
+    os.close(fd)
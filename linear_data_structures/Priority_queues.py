@@ -0,0 +1,270 @@
+# A Queue serves strictly in arrival order, so an urgent job has to wait behind everything that arrived before it.
+# A priority queue serves the job with the best (lowest) priority first instead.
+
+# PriorityQueue is a binary heap kept in a list: the entry at index i has its children at 2i + 1 and 2i + 2, and no child has a better priority than its parent.
+# Enqueue adds the entry at the end and sifts it up, dequeue takes the root and sifts the last entry down from the top, both in O(log n).
+# Each entry also records an arrival number, and ties in priority are broken by it, so jobs with equal priority come out in FIFO order.
+
+# enqueue() returns the entry as a handle. The entry always knows its own index in the heap, so the handle can be used to
+# change the priority (change_priority, or decrease_key) or to cancel the job, both in O(log n) with no searching.
+
+from itertools import count
+from .Doubly_linked_lists import DoublyLinkedList
+from .exceptions import QueueFull, QueueEmpty
+
+class PriorityEntry:
+  __slots__ = ("priority", "sequence", "value", "index")
+
+  def __init__(self, priority, sequence, value, index):
+    self.priority = priority
+    self.sequence = sequence
+    self.value = value
+    self.index = index
+
+  def get_value(self):
+    return self.value
+
+  def get_priority(self):
+    return self.priority
+
+  # An entry that has been dequeued or cancelled has index None
+  def is_queued(self):
+    return self.index is not None
+
+class PriorityQueue:
+  def __init__(self, max_size=None):
+    self.heap = []
+    self.max_size = max_size
+    self.sequence = count()
+
+  def enqueue(self, value, priority=0):
+    if not self.has_space():
+      raise QueueFull("Sorry, no more room!")
+    entry = PriorityEntry(priority, next(self.sequence), value, len(self.heap))
+    self.heap.append(entry)
+    self.sift_up(entry.index)
+    return entry
+
+  def try_enqueue(self, value, priority=0):
+    if not self.has_space():
+      return None
+    return self.enqueue(value, priority)
+
+  def dequeue(self):
+    if not self.heap:
+      raise QueueEmpty("This queue is totally empty!")
+    return self.remove_at(0).value
+
+  def try_dequeue(self, default=None):
+    if not self.heap:
+      return default
+    return self.remove_at(0).value
+
+  def peek(self):
+    if not self.heap:
+      raise QueueEmpty("Nothing to see here!")
+    return self.heap[0].value
+
+  def peek_priority(self):
+    if not self.heap:
+      raise QueueEmpty("Nothing to see here!")
+    return self.heap[0].priority
+
+  # Moves a queued entry to a new priority. Its place among equal priorities is still decided by when it first arrived.
+  def change_priority(self, entry, priority):
+    if entry.index is None:
+      raise ValueError("entry is no longer in the queue")
+    old_priority = entry.priority
+    entry.priority = priority
+    if priority < old_priority:
+      self.sift_up(entry.index)
+    else:
+      self.sift_down(entry.index)
+
+  def decrease_key(self, entry, priority):
+    if priority > entry.priority:
+      raise ValueError("decrease_key cannot make a priority worse")
+    self.change_priority(entry, priority)
+
+  # Removes a queued entry and returns True, or returns False if it was already dequeued or cancelled
+  def cancel(self, entry):
+    if entry.index is None:
+      return False
+    self.remove_at(entry.index)
+    return True
+
+  def get_size(self):
+    return len(self.heap)
+
+  def __len__(self):
+    return len(self.heap)
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.get_size()
+
+  def is_empty(self):
+    return not self.heap
+
+  def remove_at(self, index):
+    heap = self.heap
+    entry = heap[index]
+    last = heap.pop()
+    if last is not entry:
+      heap[index] = last
+      last.index = index
+      if self.comes_before(last, entry):
+        self.sift_up(index)
+      else:
+        self.sift_down(index)
+    entry.index = None
+    return entry
+
+  def comes_before(self, first, second):
+    if first.priority == second.priority:
+      return first.sequence < second.sequence
+    return first.priority < second.priority
+
+  def sift_up(self, index):
+    heap = self.heap
+    entry = heap[index]
+    while index > 0:
+      parent_index = (index - 1) >> 1
+      parent = heap[parent_index]
+      if not self.comes_before(entry, parent):
+        break
+      heap[index] = parent
+      parent.index = index
+      index = parent_index
+    heap[index] = entry
+    entry.index = index
+
+  def sift_down(self, index):
+    heap = self.heap
+    size = len(heap)
+    entry = heap[index]
+    while True:
+      child_index = 2 * index + 1
+      if child_index >= size:
+        break
+      child = heap[child_index]
+      right_index = child_index + 1
+      if right_index < size and self.comes_before(heap[right_index], child):
+        child_index = right_index
+        child = heap[child_index]
+      if not self.comes_before(child, entry):
+        break
+      heap[index] = child
+      child.index = index
+      index = child_index
+    heap[index] = entry
+    entry.index = index
+
+# MultiLevelQueue keeps a separate bounded FIFO lane per priority class and serves them by weighted round-robin:
+# in every round a class with weight w gets up to w dequeues before the next class gets its turn.
+# Urgent classes get large weights, but bulk classes still make progress, so nothing starves.
+# Each class is bounded by its own max_size, and enqueue() raises QueueFull when that class is full.
+# enqueue() returns a handle that can be passed to cancel(). Each lane is a DoublyLinkedList, so cancelling unlinks the job in O(1).
+
+class PriorityClass:
+  def __init__(self, name, weight, max_size):
+    if weight < 1:
+      raise ValueError("weight must be at least 1")
+    self.name = name
+    self.weight = weight
+    self.max_size = max_size
+    self.jobs = DoublyLinkedList()
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.jobs.get_size()
+
+  # A node that was removed has no links left, unless it was the only node in the lane, in which case it is still the head
+  def holds(self, node):
+    return node.prev_node is not None or node.next_node is not None or self.jobs.head_node is node
+
+class MultiLevelQueue:
+  # classes is a list of (name, weight) or (name, weight, max_size) tuples, most urgent first
+  def __init__(self, classes):
+    self.classes = []
+    self.classes_by_name = {}
+    for spec in classes:
+      name, weight = spec[0], spec[1]
+      max_size = spec[2] if len(spec) > 2 else None
+      priority_class = PriorityClass(name, weight, max_size)
+      self.classes.append(priority_class)
+      self.classes_by_name[name] = priority_class
+    self.current = 0
+    self.credit = self.classes[0].weight if self.classes else 0
+    self.size = 0
+
+  def enqueue(self, value, class_name):
+    priority_class = self.classes_by_name[class_name]
+    if not priority_class.has_space():
+      raise QueueFull("Sorry, no more room!")
+    node = priority_class.jobs.insert_end(value)
+    self.size += 1
+    return (priority_class, node)
+
+  def try_enqueue(self, value, class_name):
+    if not self.classes_by_name[class_name].has_space():
+      return None
+    return self.enqueue(value, class_name)
+
+  def dequeue(self):
+    if self.size == 0:
+      raise QueueEmpty("This queue is totally empty!")
+    classes = self.classes
+    while True:
+      priority_class = classes[self.current]
+      if self.credit > 0 and not priority_class.jobs.is_empty():
+        self.credit -= 1
+        self.size -= 1
+        return priority_class.jobs.remove(priority_class.jobs.head_node)
+      self.current = (self.current + 1) % len(classes)
+      self.credit = classes[self.current].weight
+
+  def try_dequeue(self, default=None):
+    if self.size == 0:
+      return default
+    return self.dequeue()
+
+  def peek(self):
+    if self.size == 0:
+      raise QueueEmpty("Nothing to see here!")
+    classes = self.classes
+    index = self.current
+    credit = self.credit
+    while True:
+      priority_class = classes[index]
+      if credit > 0 and not priority_class.jobs.is_empty():
+        return priority_class.jobs.head_node.value
+      index = (index + 1) % len(classes)
+      credit = classes[index].weight
+
+  # Cancels a job using the handle returned by enqueue() and returns True, or returns False if it was already dequeued or cancelled
+  def cancel(self, handle):
+    priority_class, node = handle
+    if not priority_class.holds(node):
+      return False
+    priority_class.jobs.remove(node)
+    self.size -= 1
+    return True
+
+  def get_size(self, class_name=None):
+    if class_name is None:
+      return self.size
+    return self.classes_by_name[class_name].jobs.get_size()
+
+  def __len__(self):
+    return self.size
+
+  def has_space(self, class_name):
+    return self.classes_by_name[class_name].has_space()
+
+  def is_empty(self):
+    return self.size == 0
@@ -23,16 +23,6 @@
 # peek() which will allow us to view the value of head of the queue without returning it
 # We’ll also set up a few helper methods that will help us keep track of the queue size in order to prevent queue “overflow” and “underflow.”
 
-from node import Node
-# Create the Queue class below:
-class Queue:
-  def __init__(self):
-    self.head = None
-    self.tail = None
-    
-  def peek(self):
-    return self.head.get_value()
- 
 # Bounded queues require limits on the number of nodes that can be contained, while other queues don’t. 
 # To account for this, we will need to make some modifications to our Queue class so that we can keep track of and limit size where needed.
 # We’ll be adding two new properties to help us out here:
@@ -43,86 +33,12 @@ class Queue:
 # has_space() will return True if the queue has space for another node
 # is_empty() will return true if the size is 0
 
-from node import Node
-
-class Queue:
-  # Add max_size and size properties within __init__():
-  def __init__(self, max_size=None):
-    self.head = None
-    self.tail = None
-    self.max_size = max_size
-    self.size = 0
-    
-  def peek(self):
-    if self.size > 0:
-      return self.head.get_value()
-    else:
-      print("Nothing to see here!")
-  
-  # Define get_size() and has_space() below:
-  def get_size(self):
-    return self.size
-  
-  def has_space(self):
-    if self.max_size == None:
-      return True
-    else:
-      return self.max_size > self.get_size()
-    
-  def is_empty(self):
-    return self.size == 0
- 
 # “Enqueue” is a fancy way of saying “add to a queue,” and that is exactly what we’re doing with the enqueue() method.
 # There are three scenarios that we are concerned with when adding a node to the queue:
 # The queue is empty, so the node we’re adding is both the head and tail of the queue
 # The queue has at least one other node, so the added node becomes the new tail
 # The queue is full, so the node will not get added because we don’t want queue “overflow”
 
-from node import Node
-
-class Queue:
-  def __init__(self, max_size=None):
-    self.head = None
-    self.tail = None
-    self.max_size = max_size
-    self.size = 0
-    
-  # Add your enqueue method below:
-  def enqueue(self, value):
-    if self.has_space():
-      item_to_add = Node(value)
-      print("Adding " + str(item_to_add.get_value()) + " to the queue!")
-      if self.is_empty():
-        self.head = item_to_add
-        self.tail = item_to_add
-      else:
-        self.tail.set_next_node(item_to_add)
-        self.tail = item_to_add
-      self.size += 1
-    else:
-      print("Sorry, no more room!")
-    
-  def peek(self):
-    if self.is_empty():
-      print("Nothing to see here!")
-    else:
-      return self.head.get_value()
-  
-  def get_size(self):
-    return self.size
-  
-  def has_space(self):
-    if self.max_size == None:
-      return True
-    else:
-      return self.max_size > self.get_size()
-    
-  def is_empty(self):
-    return self.size == 0
-
-q = Queue()
-q.enqueue("all the fluffy kitties")
-
 # We can add items to the tail of our queue, but we remove them from the head using a method known as dequeue(), which is another way to say “remove from a queue”. 
 # Like enqueue(), we care about the size of the queue — but in the other direction, so that we prevent queue “underflow”. 
 # After all, you don’t want to remove something that isn’t there!
@@ -133,19 +49,34 @@ q.enqueue("all the fluffy kitties")
 # The queue has one node, so when we remove it, the queue will be empty and we need to reset the queue’s head and tail to None
 # The queue has more than one node, and we just remove the head node and reset the head to the following node
 
-from node import Node
-
-class Queue:
-  def __init__(self, max_size=None):
+# Printing a message on every enqueue and dequeue is handy while learning, but it is by far the slowest part of the queue.
+# This version stays silent: overflow raises QueueFull and underflow raises QueueEmpty, while try_enqueue() and try_dequeue() report the same conditions without raising.
+# Anyone who still wants to watch the queue can set event_hook to a function. It is called as event_hook(queue, event, value) with
+# the events "enqueue", "dequeue", "enqueue_many", "dequeue_many" (value is the number of items), "full" and "empty".
+# When event_hook is None, the only cost is a single attribute check.
+# Passing a NodePool (see node.py) as node_pool makes the queue recycle the nodes it dequeues instead of allocating a new node for every enqueue.
+# Iterating over a queue yields its values from head to tail without removing them, and len() is its size.
+
+from itertools import islice
+from .node import Node
+from .exceptions import QueueFull, QueueEmpty
+from .iteration import IterableMixin
+
+class Queue(IterableMixin):
+  def __init__(self, max_size=None, node_pool=None):
     self.head = None
     self.tail = None
     self.max_size = max_size
     self.size = 0
+    self.event_hook = None
+    self.node_pool = node_pool
     
   def enqueue(self, value):
     if self.has_space():
-      item_to_add = Node(value)
-      print("Adding " + str(item_to_add.get_value()) + " to the queue!")
+      if self.node_pool is None:
+        item_to_add = Node(value)
+      else:
+        item_to_add = self.node_pool.acquire(value)
       if self.is_empty():
         self.head = item_to_add
         self.tail = item_to_add
@@ -153,27 +84,105 @@ class Queue:
         self.tail.set_next_node(item_to_add)
         self.tail = item_to_add
       self.size += 1
+      if self.event_hook is not None:
+        self.event_hook(self, "enqueue", value)
     else:
-      print("Sorry, no more room!")
+      if self.event_hook is not None:
+        self.event_hook(self, "full", value)
+      raise QueueFull("Sorry, no more room!")
+
+  def try_enqueue(self, value):
+    try:
+      self.enqueue(value)
+    except QueueFull:
+      return False
+    return True
       
-  # Add your dequeue method below:    
   def dequeue(self):
     if self.get_size() > 0:
       item_to_remove = self.head
-      print("Removing " + str(item_to_remove.get_value()) + " from the queue!")
       if self.get_size() == 1:
         self.head = None
         self.tail = None
       else:
         self.head = self.head.get_next_node()
       self.size -= 1
-      return item_to_remove.get_value()
+      value = item_to_remove.get_value()
+      if self.node_pool is not None:
+        self.node_pool.release(item_to_remove)
+      if self.event_hook is not None:
+        self.event_hook(self, "dequeue", value)
+      return value
     else:
-      print("This queue is totally empty!")
+      if self.event_hook is not None:
+        self.event_hook(self, "empty", None)
+      raise QueueEmpty("This queue is totally empty!")
+
+  def try_dequeue(self, default=None):
+    if self.is_empty():
+      return default
+    return self.dequeue()
+
+  # Producers often hand over many items at once. Checking has_space() and creating the nodes one call at a time
+  # repeats the same work for every item, so the batch methods check the remaining room once, link the whole run
+  # of nodes together in one pass and attach it to the tail. They return how many items were accepted, which may
+  # be fewer than offered when a bounded queue fills up; the rest of an iterator is left unconsumed.
+  def enqueue_many(self, values):
+    if self.max_size is not None:
+      values = islice(values, max(self.max_size - self.size, 0))
+    new_node = Node if self.node_pool is None else self.node_pool.acquire
+    first = None
+    last = None
+    count = 0
+    for value in values:
+      item_to_add = new_node(value)
+      if last is None:
+        first = item_to_add
+      else:
+        last.next_node = item_to_add
+      last = item_to_add
+      count += 1
+    if count:
+      if self.is_empty():
+        self.head = first
+      else:
+        self.tail.set_next_node(first)
+      self.tail = last
+      self.size += count
+      if self.event_hook is not None:
+        self.event_hook(self, "enqueue_many", count)
+    return count
+
+  # Removes up to count items from the head (all of them when count is None) and returns their values in order
+  def dequeue_many(self, count=None):
+    if count is None or count > self.size:
+      count = self.size
+    count = max(count, 0)
+    values = []
+    append = values.append
+    item = self.head
+    if self.node_pool is None:
+      for _ in range(count):
+        append(item.value)
+        item = item.next_node
+    else:
+      release = self.node_pool.release
+      for _ in range(count):
+        append(item.value)
+        next_item = item.next_node
+        release(item)
+        item = next_item
+    self.head = item
+    if item is None:
+      self.tail = None
+    self.size -= count
+    if count and self.event_hook is not None:
+      self.event_hook(self, "dequeue_many", count)
+    return values
   
   def peek(self):
     if self.is_empty():
-      print("Nothing to see here!")
+      raise QueueEmpty("Nothing to see here!")
     else:
       return self.head.get_value()
   
@@ -189,9 +198,11 @@ class Queue:
   def is_empty(self):
     return self.size == 0
 
-q = Queue()
-q.enqueue("some guy with a mustache")
-q.dequeue()
-
-
+  def __iter__(self):
+    item = self.head
+    while item is not None:
+      yield item.value
+      item = item.next_node
 
+  def __len__(self):
+    return self.size
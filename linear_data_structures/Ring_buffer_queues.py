@@ -0,0 +1,163 @@
+# A queue does not have to be built out of nodes.
+# The linked Queue creates a brand new Node for every enqueue and throws it away on every dequeue, so a busy queue spends most of its time allocating and collecting nodes.
+# A ring buffer (or circular array) keeps the items in one preallocated list instead.
+# Two numbers describe the queue: the index of the head item and the number of items stored.
+# The tail is found by counting size slots forward from the head, wrapping around to the start of the list when we run off the end.
+# Enqueue writes into the slot after the tail and dequeue reads the head slot and moves the head forward, so both are O(1) and no objects are created.
+
+# Bounded queues know their max_size up front, so the array is sized to hold exactly that many items and never has to grow.
+# Unbounded queues start small and double their array when it fills up. Growing copies the items once, which keeps enqueue O(1) on average.
+
+# Like the finished Queue, the RingBufferQueue raises QueueFull and QueueEmpty instead of printing, offers try_enqueue() and try_dequeue(),
+# and calls event_hook(queue, event, value) with the same events when a hook is set.
+
+# Iterating yields the values from head to tail, and because the items sit in an array, reversed() is just as cheap.
+
+from itertools import islice
+from .exceptions import QueueFull, QueueEmpty
+from .iteration import IterableMixin
+
+class RingBufferQueue(IterableMixin):
+  def __init__(self, max_size=None, initial_capacity=16):
+    self.max_size = max_size
+    if max_size is None:
+      capacity = initial_capacity
+    else:
+      capacity = max_size
+    self.items = [None] * max(capacity, 1)
+    self.head = 0
+    self.size = 0
+    self.event_hook = None
+
+  def enqueue(self, value):
+    if self.max_size is None or self.size < self.max_size:
+      items = self.items
+      capacity = len(items)
+      if self.size == capacity:
+        self.grow()
+        items = self.items
+        capacity = len(items)
+      tail = self.head + self.size
+      if tail >= capacity:
+        tail -= capacity
+      items[tail] = value
+      self.size += 1
+      if self.event_hook is not None:
+        self.event_hook(self, "enqueue", value)
+    else:
+      if self.event_hook is not None:
+        self.event_hook(self, "full", value)
+      raise QueueFull("Sorry, no more room!")
+
+  def try_enqueue(self, value):
+    try:
+      self.enqueue(value)
+    except QueueFull:
+      return False
+    return True
+
+  def dequeue(self):
+    if self.size > 0:
+      items = self.items
+      head = self.head
+      value = items[head]
+      # Clear the slot so the queue does not keep the value alive after handing it out
+      items[head] = None
+      head += 1
+      if head == len(items):
+        head = 0
+      self.head = head
+      self.size -= 1
+      if self.event_hook is not None:
+        self.event_hook(self, "dequeue", value)
+      return value
+    else:
+      if self.event_hook is not None:
+        self.event_hook(self, "empty", None)
+      raise QueueEmpty("This queue is totally empty!")
+
+  def try_dequeue(self, default=None):
+    if self.size == 0:
+      return default
+    return self.dequeue()
+
+  # Batches are copied in and out with at most two slice assignments: one up to the end of the array and one for the part that wraps around
+  def enqueue_many(self, values):
+    if self.max_size is None:
+      values = list(values)
+    else:
+      values = list(islice(values, max(self.max_size - self.size, 0)))
+    count = len(values)
+    while self.size + count > len(self.items):
+      self.grow()
+    items = self.items
+    capacity = len(items)
+    tail = (self.head + self.size) % capacity
+    first_run = min(count, capacity - tail)
+    items[tail:tail + first_run] = values[:first_run]
+    items[:count - first_run] = values[first_run:]
+    self.size += count
+    if count and self.event_hook is not None:
+      self.event_hook(self, "enqueue_many", count)
+    return count
+
+  def dequeue_many(self, count=None):
+    if count is None or count > self.size:
+      count = self.size
+    count = max(count, 0)
+    items = self.items
+    capacity = len(items)
+    head = self.head
+    first_run = min(count, capacity - head)
+    values = items[head:head + first_run]
+    items[head:head + first_run] = [None] * first_run
+    if count > first_run:
+      values += items[:count - first_run]
+      items[:count - first_run] = [None] * (count - first_run)
+    self.head = (head + count) % capacity
+    self.size -= count
+    if count and self.event_hook is not None:
+      self.event_hook(self, "dequeue_many", count)
+    return values
+
+  def peek(self):
+    if self.is_empty():
+      raise QueueEmpty("Nothing to see here!")
+    else:
+      return self.items[self.head]
+
+  def get_size(self):
+    return self.size
+
+  def has_space(self):
+    if self.max_size is None:
+      return True
+    else:
+      return self.max_size > self.get_size()
+
+  def is_empty(self):
+    return self.size == 0
+
+  def __iter__(self):
+    items = self.items
+    capacity = len(items)
+    head = self.head
+    for offset in range(self.size):
+      yield items[(head + offset) % capacity]
+
+  def __reversed__(self):
+    items = self.items
+    capacity = len(items)
+    head = self.head
+    for offset in range(self.size - 1, -1, -1):
+      yield items[(head + offset) % capacity]
+
+  def __len__(self):
+    return self.size
+
+  # Unrolls the items into a list twice as large, with the head moved back to index 0
+  def grow(self):
+    items = self.items
+    capacity = len(items)
+    self.items = items[self.head:] + items[:self.head] + [None] * capacity
+    self.head = 0
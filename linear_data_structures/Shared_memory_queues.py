@@ -0,0 +1,268 @@
+# A Queue only lives inside one process, and multiprocessing.Queue pickles every item and pushes it through a pipe with a feeder thread.
+# SharedMemoryQueue is a bounded queue in a multiprocessing.shared_memory block, so any process that attaches to the block can use it,
+# and an item costs one copy into the block and, unless the consumer reads it in place, one copy out.
+
+# The block starts with two counters: tail, the number of items ever enqueued, and head, the number ever dequeued.
+# Their difference is the size. They sit on separate 64 byte cache lines, so the producer and the consumer do not keep stealing one line from each other.
+# After the counters comes a small layout record (max_size and slot_size), so a process can attach knowing only the name of the block.
+# The rest is max_size fixed-size slots, used as a ring: item number n goes into slot n % max_size. Each slot holds a 4 byte length and up to slot_size bytes.
+
+# With one producer and one consumer no lock is needed. Only the producer writes tail and only the consumer writes head.
+# The producer copies the payload into the slot before it moves tail on, and the consumer reads the slot before it moves head on,
+# so neither ever sees a slot the other one is still working on. This relies on the stores becoming visible to the other process in the order
+# they are made, which x86-64 guarantees, so the lock-free mode is for x86-64 only.
+# On platforms with a weaker memory model (such as ARM), pass one multiprocessing.Lock as both producer_lock and consumer_lock.
+# Every enqueue and dequeue then runs under that single lock, and acquiring and releasing it orders the slot and counter stores between the two sides.
+# Two separate locks only order each side against itself, not against the other, so they are not enough there.
+# On x86-64, more producers (or consumers) need to take turns: pass a multiprocessing.Lock as producer_lock (or consumer_lock) and every process
+# on that side holds it while it enqueues (or dequeues). With separate locks, producers and consumers still never wait for each other.
+
+# enqueue(), dequeue() and has_space() work as in Queue, raising QueueFull and QueueEmpty. put() and get() wait for room or an item,
+# optionally giving up after timeout seconds. There is no cross-process condition to wait on, so they poll, backing off up to a millisecond.
+# Payloads are bytes-like objects of up to slot_size bytes. Pass serializer and deserializer (for example pickle.dumps and pickle.loads) to send other values.
+
+# dequeue() and peek() return a copy of the payload. dequeue_view() and peek_view() return a memoryview straight into the slot instead.
+# The slot of a dequeue_view() is handed back to the producer by the consumer's next dequeue, so the view stays valid until then;
+# that is also why dequeue_view() needs a single consumer without a consumer_lock, which makes the zero-copy reads x86-64 only.
+# Release the views (or drop them) before calling close().
+
+# The process that creates the queue owns the shared memory block and unlinks it when the queue is closed;
+# other processes attach with SharedMemoryQueue(name=queue.name, create=False), or simply receive the queue as an argument to a Process.
+
+import struct
+from time import monotonic, sleep
+from multiprocessing import shared_memory
+from .exceptions import QueueFull, QueueEmpty
+
+COUNTER = struct.Struct("<Q")
+LAYOUT = struct.Struct("<QQ")
+LENGTH = struct.Struct("<I")
+HEAD_OFFSET = 0
+TAIL_OFFSET = 64
+LAYOUT_OFFSET = 128
+SLOTS_OFFSET = 192
+
+class SharedMemoryQueue:
+  def __init__(self, max_size=1024, slot_size=256, name=None, create=True, producer_lock=None, consumer_lock=None,
+               serializer=None, deserializer=None):
+    if create:
+      if max_size < 1 or slot_size < 1:
+        raise ValueError("max_size and slot_size must be at least 1")
+      stride = (LENGTH.size + slot_size + 7) // 8 * 8
+      self.memory = shared_memory.SharedMemory(name=name, create=True, size=SLOTS_OFFSET + max_size * stride)
+      self.memory.buf[:SLOTS_OFFSET] = bytes(SLOTS_OFFSET)
+      LAYOUT.pack_into(self.memory.buf, LAYOUT_OFFSET, max_size, slot_size)
+    else:
+      # Only the owner should ever unlink the block. Before Python 3.13 attaching can't opt out of the resource tracker, which is harmless for
+      # processes started by multiprocessing since they share their parent's tracker. A process started some other way has a tracker
+      # of its own that removes the block's name when the process exits; processes that are already attached keep working.
+      try:
+        self.memory = shared_memory.SharedMemory(name=name, track=False)
+      except TypeError:
+        self.memory = shared_memory.SharedMemory(name=name)
+      max_size, slot_size = LAYOUT.unpack_from(self.memory.buf, LAYOUT_OFFSET)
+    self.name = self.memory.name
+    self.owner = create
+    self.max_size = max_size
+    self.slot_size = slot_size
+    self.stride = (LENGTH.size + slot_size + 7) // 8 * 8
+    self.buf = self.memory.buf
+    self.producer_lock = producer_lock
+    self.consumer_lock = consumer_lock
+    self.serializer = serializer
+    self.deserializer = deserializer
+    self.pending = False
+
+  # Sending the queue to another process sends the name of its block and the locks; the other side attaches to the same block
+  def __reduce__(self):
+    return (SharedMemoryQueue, (self.max_size, self.slot_size, self.name, False, self.producer_lock, self.consumer_lock,
+                                self.serializer, self.deserializer))
+
+  def slot_offset(self, counter):
+    return SLOTS_OFFSET + (counter % self.max_size) * self.stride
+
+  # ---- producer side ----
+
+  def enqueue(self, value):
+    payload = value if self.serializer is None else self.serializer(value)
+    view = memoryview(payload)
+    if view.format != "B" or view.ndim != 1:
+      view = view.cast("B")
+    length = view.nbytes
+    if length > self.slot_size:
+      raise ValueError("a payload of {} bytes does not fit in a slot of {} bytes".format(length, self.slot_size))
+    if self.producer_lock is None:
+      self.write_slot(view, length)
+    else:
+      with self.producer_lock:
+        self.write_slot(view, length)
+
+  def write_slot(self, view, length):
+    buf = self.buf
+    tail = COUNTER.unpack_from(buf, TAIL_OFFSET)[0]
+    if tail - COUNTER.unpack_from(buf, HEAD_OFFSET)[0] >= self.max_size:
+      raise QueueFull("Sorry, no more room!")
+    offset = self.slot_offset(tail)
+    start = offset + LENGTH.size
+    buf[start:start + length] = view
+    LENGTH.pack_into(buf, offset, length)
+    COUNTER.pack_into(buf, TAIL_OFFSET, tail + 1)
+
+  def try_enqueue(self, value):
+    try:
+      self.enqueue(value)
+    except QueueFull:
+      return False
+    return True
+
+  def put(self, value, block=True, timeout=None):
+    deadline = None if timeout is None else monotonic() + timeout
+    if block:
+      self.wait(self.has_space, deadline, QueueFull("Sorry, no more room!"))
+    while True:
+      try:
+        self.enqueue(value)
+        return
+      except QueueFull:
+        # Another producer took the room first; keep waiting, but only until the original deadline
+        if not block or self.expired(deadline):
+          raise
+        self.wait(self.has_space, deadline, QueueFull("Sorry, no more room!"))
+
+  # ---- consumer side ----
+
+  # Hands the slot of the last dequeue_view() back to the producer
+  def release_pending(self):
+    if self.pending:
+      self.pending = False
+      COUNTER.pack_into(self.buf, HEAD_OFFSET, COUNTER.unpack_from(self.buf, HEAD_OFFSET)[0] + 1)
+
+  def read_slot(self, advance):
+    self.release_pending()
+    buf = self.buf
+    head = COUNTER.unpack_from(buf, HEAD_OFFSET)[0]
+    if head == COUNTER.unpack_from(buf, TAIL_OFFSET)[0]:
+      raise QueueEmpty("This queue is totally empty!" if advance else "Nothing to see here!")
+    offset = self.slot_offset(head)
+    start = offset + LENGTH.size
+    payload = bytes(buf[start:start + LENGTH.unpack_from(buf, offset)[0]])
+    if advance:
+      COUNTER.pack_into(buf, HEAD_OFFSET, head + 1)
+    return payload
+
+  def dequeue(self):
+    if self.consumer_lock is None:
+      payload = self.read_slot(True)
+    else:
+      with self.consumer_lock:
+        payload = self.read_slot(True)
+    if self.deserializer is None:
+      return payload
+    return self.deserializer(payload)
+
+  def try_dequeue(self, default=None):
+    try:
+      return self.dequeue()
+    except QueueEmpty:
+      return default
+
+  def get(self, block=True, timeout=None):
+    deadline = None if timeout is None else monotonic() + timeout
+    if block:
+      self.wait(self.has_items, deadline, QueueEmpty("This queue is totally empty!"))
+    while True:
+      try:
+        return self.dequeue()
+      except QueueEmpty:
+        # Another consumer took the item first; keep waiting, but only until the original deadline
+        if not block or self.expired(deadline):
+          raise
+        self.wait(self.has_items, deadline, QueueEmpty("This queue is totally empty!"))
+
+  def peek(self):
+    if self.consumer_lock is None:
+      payload = self.read_slot(False)
+    else:
+      with self.consumer_lock:
+        payload = self.read_slot(False)
+    if self.deserializer is None:
+      return payload
+    return self.deserializer(payload)
+
+  # A memoryview of the head slot. It stays valid until the next dequeue on this consumer.
+  def dequeue_view(self):
+    if self.consumer_lock is not None:
+      raise ValueError("dequeue_view() needs a single consumer")
+    view = self.peek_view()
+    self.pending = True
+    return view
+
+  # A memoryview of the head slot, without removing it
+  def peek_view(self):
+    self.release_pending()
+    buf = self.buf
+    head = COUNTER.unpack_from(buf, HEAD_OFFSET)[0]
+    if head == COUNTER.unpack_from(buf, TAIL_OFFSET)[0]:
+      raise QueueEmpty("Nothing to see here!")
+    offset = self.slot_offset(head)
+    start = offset + LENGTH.size
+    return buf[start:start + LENGTH.unpack_from(buf, offset)[0]]
+
+  # ---- size ----
+
+  # Slots in use, including the one a pending dequeue_view() still holds
+  def used_slots(self):
+    buf = self.buf
+    return COUNTER.unpack_from(buf, TAIL_OFFSET)[0] - COUNTER.unpack_from(buf, HEAD_OFFSET)[0]
+
+  def get_size(self):
+    return self.used_slots() - self.pending
+
+  def __len__(self):
+    return self.get_size()
+
+  def has_space(self):
+    return self.used_slots() < self.max_size
+
+  def has_items(self):
+    return self.get_size() > 0
+
+  def is_empty(self):
+    return self.get_size() == 0
+
+  # Polls condition, yielding the CPU at first and then sleeping for longer and longer up to a millisecond.
+  # Raises error once the monotonic() deadline has passed; a deadline of None waits forever
+  def wait(self, condition, deadline, error):
+    delay = 0
+    while not condition():
+      if deadline is None:
+        sleep(delay)
+      else:
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+          raise error
+        sleep(min(delay, remaining))
+      delay = min(delay * 2 or 0.00001, 0.001)
+
+  def expired(self, deadline):
+    return deadline is not None and monotonic() >= deadline
+
+  # ---- closing ----
+
+  def close(self):
+    if self.buf is None:
+      return
+    self.release_pending()
+    self.buf = None
+    self.memory.close()
+    if self.owner:
+      try:
+        self.memory.unlink()
+      except FileNotFoundError:
+        pass
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
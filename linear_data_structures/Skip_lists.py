@@ -0,0 +1,245 @@
+# Finding a value in a sorted linked list still means walking it from the head, one node at a time.
+# A skip list adds express lanes on top of the chain. Every node is on level 0, the ordinary linked list, and each node is also
+# given a random number of extra levels: with probability 0.25 it reaches level 1, with 0.25 of that level 2, and so on.
+# Each level links a node to the next node that reaches the same level, so the higher levels skip over more and more of the list.
+# A search starts on the highest level at the head and moves right while the next value is still smaller, then drops down a level.
+# On average it looks at a handful of nodes per level, so search, insert and remove take O(log n) expected time.
+
+# SkipNode is a Node whose next_node is its level 0 link, so anything that walks Nodes with get_next_node() can walk a skip list.
+# Its forward list holds the links for every level it reaches, forward[0] included.
+# widths[level] counts how many level 0 steps the link on that level jumps over. Adding up the widths along a search path gives the
+# position reached, which makes get(index) and rank(value) O(log n) as well. The head node is position 0; a link that runs off
+# the end counts the steps to a position one past the last node.
+
+# Values are kept in ascending order and have to be comparable with each other, e.g. timestamps or (timestamp, payload) tuples.
+# Equal values are allowed; a new one goes in after the ones already there, and remove_node() removes the first one.
+# range(start, stop) and index_range(start, stop) find their first node in O(log n) and then walk level 0 lazily,
+# so scanning k values costs O(log n + k) and stops as soon as the caller stops iterating.
+# Passing values to the constructor sorts them once and links all the levels in a single pass, which is much faster than inserting one by one.
+
+from random import random
+from itertools import islice
+from .node import Node
+from .iteration import IterableMixin, Pipeline
+
+class SkipNode(Node):
+  __slots__ = ("forward", "widths")
+
+  def __init__(self, value, level):
+    self.value = value
+    self.next_node = None
+    self.forward = [None] * level
+    self.widths = [1] * level
+
+  def get_level(self):
+    return len(self.forward)
+
+class SkipList(IterableMixin):
+  def __init__(self, values=None, max_level=32, probability=0.25):
+    if max_level < 1:
+      raise ValueError("max_level must be at least 1")
+    self.max_level = max_level
+    self.probability = probability
+    self.head_node = SkipNode(None, max_level)
+    self.level = 1
+    self.size = 0
+    if values is not None:
+      self.build(sorted(values))
+
+  def random_level(self):
+    level = 1
+    while level < self.max_level and random() < self.probability:
+      level += 1
+    return level
+
+  # Links already sorted values into the empty list, keeping the last node seen on each level and its position
+  def build(self, ordered):
+    head = self.head_node
+    tails = [head] * self.max_level
+    tail_positions = [0] * self.max_level
+    level_in_use = 1
+    position = 0
+    for value in ordered:
+      position += 1
+      node_level = self.random_level()
+      node = SkipNode(value, node_level)
+      tails[0].next_node = node
+      for level in range(node_level):
+        tail = tails[level]
+        tail.forward[level] = node
+        tail.widths[level] = position - tail_positions[level]
+        tails[level] = node
+        tail_positions[level] = position
+      if node_level > level_in_use:
+        level_in_use = node_level
+    for level in range(self.max_level):
+      tails[level].widths[level] = position + 1 - tail_positions[level]
+    self.level = level_in_use
+    self.size = position
+
+  def get_head_node(self):
+    return self.head_node
+
+  # Walks down from the top level and returns, for every level, the last node whose value is below value along with its position.
+  # With after_equal set the walk also moves past values equal to value, which is where insert() puts a new copy.
+  def search_path(self, value, after_equal=False):
+    update = [None] * self.max_level
+    positions = [0] * self.max_level
+    node = self.head_node
+    position = 0
+    for level in range(self.level - 1, -1, -1):
+      next_node = node.forward[level]
+      while next_node is not None and (next_node.value < value or (after_equal and not value < next_node.value)):
+        position += node.widths[level]
+        node = next_node
+        next_node = node.forward[level]
+      update[level] = node
+      positions[level] = position
+    return update, positions
+
+  def insert(self, value):
+    update, positions = self.search_path(value, after_equal=True)
+    node_level = self.random_level()
+    if node_level > self.level:
+      head = self.head_node
+      for level in range(self.level, node_level):
+        update[level] = head
+        positions[level] = 0
+        head.widths[level] = self.size + 1
+      self.level = node_level
+    new_node = SkipNode(value, node_level)
+    new_position = positions[0] + 1
+    for level in range(node_level):
+      prev_node = update[level]
+      steps = new_position - positions[level]
+      new_node.forward[level] = prev_node.forward[level]
+      new_node.widths[level] = prev_node.widths[level] - steps + 1
+      prev_node.forward[level] = new_node
+      prev_node.widths[level] = steps
+    for level in range(node_level, self.level):
+      update[level].widths[level] += 1
+    new_node.next_node = new_node.forward[0]
+    update[0].next_node = new_node
+    self.size += 1
+    return new_node
+
+  # Removes the first node holding value_to_remove and returns True, or returns False when there is none
+  def remove_node(self, value_to_remove):
+    update, _ = self.search_path(value_to_remove)
+    node = update[0].forward[0]
+    if node is None or node.value != value_to_remove:
+      return False
+    for level in range(self.level):
+      prev_node = update[level]
+      if prev_node.forward[level] is node:
+        prev_node.forward[level] = node.forward[level]
+        prev_node.widths[level] += node.widths[level] - 1
+      else:
+        prev_node.widths[level] -= 1
+    update[0].next_node = node.forward[0]
+    head = self.head_node
+    while self.level > 1 and head.forward[self.level - 1] is None:
+      self.level -= 1
+    self.size -= 1
+    return True
+
+  # Returns the first node holding value, or None
+  def find(self, value):
+    node = self.head_node
+    for level in range(self.level - 1, -1, -1):
+      next_node = node.forward[level]
+      while next_node is not None and next_node.value < value:
+        node = next_node
+        next_node = node.forward[level]
+    node = node.forward[0]
+    if node is not None and node.value == value:
+      return node
+    return None
+
+  def contains(self, value):
+    return self.find(value) is not None
+
+  # How many values are smaller than value, which is also the index value has or would have in the list
+  def rank(self, value):
+    position = 0
+    node = self.head_node
+    for level in range(self.level - 1, -1, -1):
+      next_node = node.forward[level]
+      while next_node is not None and next_node.value < value:
+        position += node.widths[level]
+        node = next_node
+        next_node = node.forward[level]
+    return position
+
+  # How many values v satisfy start <= v < stop
+  def count_range(self, start, stop):
+    return max(self.rank(stop) - self.rank(start), 0)
+
+  def locate(self, index):
+    if index < 0:
+      index += self.size
+    if index < 0 or index >= self.size:
+      raise IndexError("skip list index out of range")
+    target = index + 1
+    position = 0
+    node = self.head_node
+    for level in range(self.level - 1, -1, -1):
+      while node.forward[level] is not None and position + node.widths[level] <= target:
+        position += node.widths[level]
+        node = node.forward[level]
+    return node
+
+  def get(self, index):
+    return self.locate(index).value
+
+  # Removes the value at index (the last one by default) and returns it
+  def pop(self, index=-1):
+    value = self.get(index)
+    self.remove_node(value)
+    return value
+
+  # Lazily yields the values v with start <= v < stop; either bound can be None to leave that end open
+  def range(self, start=None, stop=None):
+    return Pipeline(self.iterate_range(start, stop))
+
+  def iterate_range(self, start, stop):
+    if start is None:
+      node = self.head_node.forward[0]
+    else:
+      node = self.head_node
+      for level in range(self.level - 1, -1, -1):
+        next_node = node.forward[level]
+        while next_node is not None and next_node.value < start:
+          node = next_node
+          next_node = node.forward[level]
+      node = node.forward[0]
+    while node is not None and (stop is None or node.value < stop):
+      yield node.value
+      node = node.next_node
+
+  # Lazily yields the values at positions start up to, but not including, stop, like a slice
+  def index_range(self, start=0, stop=None):
+    start, stop, _ = slice(start, stop).indices(self.size)
+    if start >= stop:
+      return Pipeline(iter(()))
+    return Pipeline(islice(self.iterate_from(self.locate(start)), stop - start))
+
+  def iterate_from(self, node):
+    while node is not None:
+      yield node.value
+      node = node.next_node
+
+  def __iter__(self):
+    return self.iterate_from(self.head_node.next_node)
+
+  def __len__(self):
+    return self.size
+
+  def get_size(self):
+    return self.size
+
+  def is_empty(self):
+    return self.size == 0
+
+  def stringify_list(self):
+    return "".join([str(value) + "\n" for value in self])
@@ -0,0 +1,162 @@
+# A stack is a data structure which contains an ordered set of data.
+# Stacks provide three methods for interaction:
+# Push - adds data to the “top” of the stack
+# Pop - returns and removes data from the “top” of the stack
+# Peek - returns data from the “top” of the stack without removing it
+
+# Stacks mimic a physical “stack” of objects. Consider a set of gym weights.
+# Each plate has a weight (the data). The first plate you add, or push, onto the floor is both the bottom and top of the stack. Each weight added becomes the new top of the stack.
+# At any point, the only weight you can remove, or pop, from the stack is the top one. You can peek and read the top weight without removing it from the stack.
+# The last plate that you put down becomes the first, and only, one that you can access. This is a Last In, First Out or LIFO structure. 
+# A less frequently used term is First In, Last Out, or FILO.
+
+# Stacks can be implemented using a linked list as the underlying data structure because it’s more efficient than a list or array.
+# Depending on the implementation, the top of the stack is equivalent to the head node of a linked list and the bottom of the stack is equivalent to the tail node.
+# A constraint that may be placed on a stack is its size. This is done to limit and quantify the resources the data structure will take up when it is “full”.
+# Attempting to push data onto an already full stack will result in a stack overflow. Similarly, if you attempt to pop data from an empty stack, it will result in a stack underflow.
+
+# We also need to consider the stack’s size and tweak our methods a bit so that our stack does not “overflow”.
+
+# The stack’s push() and pop() methods are our tools to add and remove items from it. pop() additionally returns the value of the item it is removing. 
+# Keep in mind that we can only make modifications to the top of the stack.
+
+# With stacks, size matters. If we’re not careful, we can accidentally over-fill them with data. 
+# Since we don’t want any stack overflow, we need to go back and make a few modifications to our methods that help us track and limit the stack size so we can keep our stacks healthy.
+
+# Like the Queue, the finished Stack stays silent: overflow raises StackOverflow, underflow raises StackUnderflow,
+# and try_push() and try_pop() report the same conditions without raising.
+# Setting event_hook to a function gets it called as event_hook(stack, event, value) with the events
+# "push", "pop", "push_many", "pop_many" (value is the number of items), "full" and "empty".
+# Passing a NodePool (see node.py) as node_pool makes the stack recycle the nodes it pops.
+# Iterating over a stack yields its values from the top down without popping them, and len() is its size.
+# snapshot() returns an ImmutableStack holding the current contents; see Immutable_structures.py.
+
+from itertools import islice
+from .node import Node
+from .exceptions import StackOverflow, StackUnderflow
+from .iteration import IterableMixin
+from .Immutable_structures import ImmutableStack
+
+class Stack(IterableMixin):
+  def __init__(self, limit=1000, node_pool=None):
+    self.top_item = None
+    self.size = 0
+    self.limit = limit
+    self.event_hook = None
+    self.node_pool = node_pool
+  
+  def push(self, value):
+    if self.has_space():
+      if self.node_pool is None:
+        item = Node(value)
+      else:
+        item = self.node_pool.acquire(value)
+      item.set_next_node(self.top_item)
+      self.top_item = item
+      self.size += 1
+      if self.event_hook is not None:
+        self.event_hook(self, "push", value)
+    else:
+      if self.event_hook is not None:
+        self.event_hook(self, "full", value)
+      raise StackOverflow("All out of space!")
+
+  def try_push(self, value):
+    try:
+      self.push(value)
+    except StackOverflow:
+      return False
+    return True
+
+  def pop(self):
+    if not self.is_empty():
+      item_to_remove = self.top_item
+      self.top_item = item_to_remove.get_next_node()
+      self.size -= 1
+      value = item_to_remove.get_value()
+      if self.node_pool is not None:
+        self.node_pool.release(item_to_remove)
+      if self.event_hook is not None:
+        self.event_hook(self, "pop", value)
+      return value
+    else:
+      if self.event_hook is not None:
+        self.event_hook(self, "empty", None)
+      raise StackUnderflow("This stack is totally empty.")
+
+  def try_pop(self, default=None):
+    if self.is_empty():
+      return default
+    return self.pop()
+
+  # Batch versions of push() and pop(). The remaining room under the limit is checked once per batch and the
+  # new nodes are chained straight onto the top, so the last value pushed ends up on top just as with push().
+  # push_many() returns how many values were accepted; the rest of an iterator is left unconsumed.
+  def push_many(self, values):
+    values = islice(values, max(self.limit - self.size, 0))
+    new_node = Node if self.node_pool is None else self.node_pool.acquire
+    top = self.top_item
+    count = 0
+    for value in values:
+      top = new_node(value, top)
+      count += 1
+    self.top_item = top
+    self.size += count
+    if count and self.event_hook is not None:
+      self.event_hook(self, "push_many", count)
+    return count
+
+  # Pops up to count items (all of them when count is None) and returns their values, top first
+  def pop_many(self, count=None):
+    if count is None or count > self.size:
+      count = self.size
+    count = max(count, 0)
+    values = []
+    append = values.append
+    item = self.top_item
+    if self.node_pool is None:
+      for _ in range(count):
+        append(item.value)
+        item = item.next_node
+    else:
+      release = self.node_pool.release
+      for _ in range(count):
+        append(item.value)
+        next_item = item.next_node
+        release(item)
+        item = next_item
+    self.top_item = item
+    self.size -= count
+    if count and self.event_hook is not None:
+      self.event_hook(self, "pop_many", count)
+    return values
+  
+  def peek(self):
+    if not self.is_empty():
+      return self.top_item.get_value()
+    else:
+      raise StackUnderflow("Nothing to see here!")
+      
+  # Define has_space() and is_empty() below:
+  def has_space(self):
+    return self.limit > self.size
+  
+  def is_empty(self):
+    return self.size == 0
+
+  def __iter__(self):
+    item = self.top_item
+    while item is not None:
+      yield item.value
+      item = item.next_node
+
+  def __len__(self):
+    return self.size
+
+  # Without a NodePool the nodes under top_item never change again, so the snapshot can share them.
+  # A NodePool reuses popped nodes, so then the values are copied into new nodes instead.
+  def snapshot(self):
+    if self.node_pool is None:
+      return ImmutableStack(self.limit, self.top_item, self.size)
+    return ImmutableStack(self.limit).push_many(reversed(list(self)))
+ 
@@ -0,0 +1,154 @@
+# In a LinkedList every value gets a node of its own, and walking the list means following one link per value.
+# An unrolled linked list stores a small array of values in each node instead, up to block_size of them.
+# Walking it follows one link per block and then reads the values straight out of the array, and the per-node overhead is shared by a whole block of values.
+
+# Adding at either end fills the end block before starting a new one, and the blocks in between are kept from thinning out, so the list never degenerates into a plain linked list:
+# - inserting into a full block splits it into two half-full blocks
+# - removing from a block that drops below half full merges it with the next block if they fit together,
+#   or otherwise borrows values from the front of the next block
+# Inserting or removing at an index walks the blocks, not the values, and then shifts at most block_size values inside one block.
+
+from .node import Node
+from .iteration import IterableMixin
+
+class UnrolledLinkedList(IterableMixin):
+  def __init__(self, block_size=64):
+    if block_size < 2:
+      raise ValueError("block_size must be at least 2")
+    self.block_size = block_size
+    self.head_node = None
+    self.tail_node = None
+    self.size = 0
+
+  def get_head_node(self):
+    return self.head_node
+
+  def insert_beginning(self, new_value):
+    head_node = self.head_node
+    if head_node is None or len(head_node.value) >= self.block_size:
+      self.head_node = Node([new_value], head_node)
+      if head_node is None:
+        self.tail_node = self.head_node
+    else:
+      head_node.value.insert(0, new_value)
+    self.size += 1
+
+  def insert_end(self, new_value):
+    tail_node = self.tail_node
+    if tail_node is None or len(tail_node.value) >= self.block_size:
+      new_node = Node([new_value])
+      if tail_node is None:
+        self.head_node = new_node
+      else:
+        tail_node.next_node = new_node
+      self.tail_node = new_node
+    else:
+      tail_node.value.append(new_value)
+    self.size += 1
+
+  def insert(self, index, new_value):
+    if index < 0:
+      index += self.size
+    if index <= 0:
+      self.insert_beginning(new_value)
+      return
+    if index >= self.size:
+      self.insert_end(new_value)
+      return
+    block, offset = self.locate(index)
+    values = block.value
+    values.insert(offset, new_value)
+    if len(values) > self.block_size:
+      half = len(values) // 2
+      new_node = Node(values[half:], block.next_node)
+      del values[half:]
+      block.next_node = new_node
+      if self.tail_node is block:
+        self.tail_node = new_node
+    self.size += 1
+
+  # Returns the block holding the value at index, and the position of the value inside that block
+  def locate(self, index):
+    if index < 0:
+      index += self.size
+    if index < 0 or index >= self.size:
+      raise IndexError("list index out of range")
+    block = self.head_node
+    while index >= len(block.value):
+      index -= len(block.value)
+      block = block.next_node
+    return block, index
+
+  def get(self, index):
+    block, offset = self.locate(index)
+    return block.value[offset]
+
+  # Removes the first occurrence of value_to_remove and returns True, or returns False when the value is not in the list
+  def remove_node(self, value_to_remove):
+    prev_block = None
+    block = self.head_node
+    while block is not None:
+      values = block.value
+      for offset in range(len(values)):
+        if values[offset] == value_to_remove:
+          del values[offset]
+          self.size -= 1
+          self.rebalance(prev_block, block)
+          return True
+      prev_block = block
+      block = block.next_node
+    return False
+
+  def pop(self, index=-1):
+    block, offset = self.locate(index)
+    value = block.value.pop(offset)
+    self.size -= 1
+    prev_block = None
+    if block is not self.head_node:
+      prev_block = self.head_node
+      while prev_block.next_node is not block:
+        prev_block = prev_block.next_node
+    self.rebalance(prev_block, block)
+    return value
+
+  def rebalance(self, prev_block, block):
+    values = block.value
+    half = self.block_size // 2
+    if len(values) >= half:
+      return
+    next_block = block.next_node
+    if next_block is not None:
+      next_values = next_block.value
+      if len(values) + len(next_values) <= self.block_size:
+        values.extend(next_values)
+        block.next_node = next_block.next_node
+        if self.tail_node is next_block:
+          self.tail_node = block
+      else:
+        borrow = half - len(values)
+        values.extend(next_values[:borrow])
+        del next_values[:borrow]
+    elif not values:
+      if prev_block is None:
+        self.head_node = None
+      else:
+        prev_block.next_node = None
+      self.tail_node = prev_block
+
+  def __iter__(self):
+    block = self.head_node
+    while block is not None:
+      yield from block.value
+      block = block.next_node
+
+  def __len__(self):
+    return self.size
+
+  def get_size(self):
+    return self.size
+
+  def is_empty(self):
+    return self.size == 0
+
+  def stringify_list(self):
+    return "".join([str(value) + "\n" for value in self if value is not None])
@@ -0,0 +1,63 @@
+# Linear data structures: nodes, linked lists, stacks, queues and the structures built on top of them.
+# Every structure is available straight from the package, e.g. from linear_data_structures import Queue.
+
+# Short-lived programs often need one structure and nothing else, so importing the package loads none of the modules.
+# Each name below maps to the module that defines it, and the module is imported the first time the name is looked up.
+# After that the name is stored in the package, so later lookups are ordinary attribute reads.
+# Importing the package does no file I/O beyond reading this file and creates no structures, which keeps it well under a millisecond.
+# benchmarks/bench_import.py keeps track of that.
+
+STRUCTURES = {
+  "Node": "node",
+  "NodePool": "node",
+  "LinearStructureError": "exceptions",
+  "QueueFull": "exceptions",
+  "QueueEmpty": "exceptions",
+  "StackOverflow": "exceptions",
+  "StackUnderflow": "exceptions",
+  "IterableMixin": "iteration",
+  "Pipeline": "iteration",
+  "chunks": "iteration",
+  "LinkedList": "Linked_lists",
+  "DoublyNode": "Doubly_linked_lists",
+  "DoublyLinkedList": "Doubly_linked_lists",
+  "UnrolledLinkedList": "Unrolled_linked_lists",
+  "SkipNode": "Skip_lists",
+  "SkipList": "Skip_lists",
+  "Queue": "Queues",
+  "RingBufferQueue": "Ring_buffer_queues",
+  "Stack": "Stacks",
+  "ImmutableStack": "Immutable_structures",
+  "ImmutableLinkedList": "Immutable_structures",
+  "MinMaxStack": "Min_max_structures",
+  "SlidingWindow": "Min_max_structures",
+  "PriorityQueue": "Priority_queues",
+  "MultiLevelQueue": "Priority_queues",
+  "ConcurrentQueue": "Concurrent_structures",
+  "ConcurrentStack": "Concurrent_structures",
+  "AsyncQueue": "Async_queues",
+  "PersistentQueue": "Persistent_queues",
+  "SharedMemoryQueue": "Shared_memory_queues",
+  "NumericStack": "Numeric_structures",
+  "NumericQueue": "Numeric_structures",
+  "LRUCache": "Caches",
+  "LFUCache": "Caches",
+  "SegmentedLRUCache": "Caches",
+  "memoize": "Caches",
+  "Metrics": "instrumentation",
+  "instrument": "instrumentation",
+}
+
+__all__ = list(STRUCTURES)
+
+def __getattr__(name):
+  module_name = STRUCTURES.get(name)
+  if module_name is None:
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+  from importlib import import_module
+  value = getattr(import_module("." + module_name, __name__), name)
+  globals()[name] = value
+  return value
+
+def __dir__():
+  return sorted(set(globals()) | set(STRUCTURES))
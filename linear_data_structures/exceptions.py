@@ -0,0 +1,22 @@
+# Overflow and underflow are errors, so the structures report them by raising one of these exceptions instead of printing a message.
+# Printing on every call also meant building a string out of every value, which is slow for large values and fills up stdout under load.
+# Callers that would rather not handle exceptions can use the try_* methods, which return a flag or a default instead.
+
+class LinearStructureError(Exception):
+  pass
+
+# Raised by enqueue() when a bounded queue has reached its max_size (queue overflow)
+class QueueFull(LinearStructureError):
+  pass
+
+# Raised by dequeue() and peek() when the queue has nothing in it (queue underflow)
+class QueueEmpty(LinearStructureError):
+  pass
+
+# Raised by push() when the stack has reached its limit
+class StackOverflow(LinearStructureError):
+  pass
+
+# Raised by pop() and peek() when the stack has nothing in it
+class StackUnderflow(LinearStructureError):
+  pass
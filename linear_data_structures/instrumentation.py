@@ -0,0 +1,199 @@
+# Instrumentation is opt-in: instrument(structure) attaches a Metrics object to a Queue, RingBufferQueue, Stack or LinkedList and returns it,
+# and metrics.detach() takes it off again. A structure that has never been instrumented pays nothing beyond its usual
+# "is event_hook None" check, and a detached one goes back to exactly that.
+
+# Metrics listens on the structure's event_hook (any hook that was already set keeps being called) and keeps track of:
+# - how many times each operation happened
+# - the high-water mark, the largest size the structure reached, next to its max_size or limit
+# - rejections, the enqueues or pushes refused because has_space() was false, and underflows, the removals from an empty structure
+# - dwell times, how long items stayed in a queue (first in, first out) or on a stack (last in, first out), as a histogram
+# Items that were already in the structure when it was instrumented have no arrival time and are left out of the dwell times.
+
+# With sample_every set, every sample_every-th call to each operation is also timed and its latency added to a histogram for that operation.
+# Timing needs a wrapper around the methods, which is installed on the instance only, so other instances of the same class are not affected.
+
+# snapshot() returns everything as a plain dict and to_json() as a JSON string, ready to be scraped.
+# Histograms use power-of-two buckets from 1 microsecond to about 70 minutes and report their count, mean, min, max and approximate percentiles.
+# Metrics are not thread-safe, so an instrumented structure should only be used from one thread.
+# Only structures with an event_hook and len() can be instrumented; ConcurrentQueue and ConcurrentStack have neither.
+
+import json
+from bisect import bisect_left
+from collections import deque
+from itertools import repeat
+from time import perf_counter
+
+BUCKET_BOUNDS = [2 ** exponent / 1e6 for exponent in range(33)]
+
+FIFO_ADDS = {"enqueue": False, "enqueue_many": True}
+FIFO_REMOVES = {"dequeue": False, "dequeue_many": True}
+LIFO_ADDS = {"push": False, "push_many": True}
+LIFO_REMOVES = {"pop": False, "pop_many": True}
+
+TIMED_METHODS = (
+  "enqueue", "dequeue", "enqueue_many", "dequeue_many",
+  "push", "pop", "push_many", "pop_many", "peek",
+  "insert_beginning", "remove_node", "find", "contains",
+)
+
+class Histogram:
+  def __init__(self):
+    self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+    self.count = 0
+    self.total = 0.0
+    self.min = None
+    self.max = None
+
+  def record(self, seconds):
+    self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+    self.count += 1
+    self.total += seconds
+    if self.min is None or seconds < self.min:
+      self.min = seconds
+    if self.max is None or seconds > self.max:
+      self.max = seconds
+
+  # Returns the upper bound of the bucket holding the given fraction of the samples
+  def percentile(self, fraction):
+    if not self.count:
+      return None
+    target = fraction * self.count
+    seen = 0
+    for index, bucket_count in enumerate(self.counts):
+      seen += bucket_count
+      if seen >= target:
+        if index < len(BUCKET_BOUNDS):
+          return min(BUCKET_BOUNDS[index], self.max)
+        return self.max
+    return self.max
+
+  def snapshot(self):
+    buckets = []
+    for index, bucket_count in enumerate(self.counts):
+      if bucket_count:
+        bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else None
+        buckets.append({"le": bound, "count": bucket_count})
+    return {
+      "count": self.count,
+      "mean": self.total / self.count if self.count else None,
+      "min": self.min,
+      "max": self.max,
+      "p50": self.percentile(0.5),
+      "p90": self.percentile(0.9),
+      "p99": self.percentile(0.99),
+      "buckets": buckets,
+    }
+
+class Metrics:
+  def __init__(self, structure, sample_every=None, clock=perf_counter):
+    self.structure = structure
+    self.sample_every = sample_every
+    self.clock = clock
+    capacity = getattr(structure, "max_size", None)
+    if capacity is None:
+      capacity = getattr(structure, "limit", None)
+    self.capacity = capacity
+    self.operations = {}
+    self.rejections = 0
+    self.underflows = 0
+    self.high_water = len(structure)
+    self.arrivals = deque(repeat(None, len(structure)))
+    self.dwell = Histogram()
+    self.latency = {}
+    self.previous_hook = None
+    self.timed_methods = []
+    self.attached = False
+
+  def attach(self):
+    if self.attached:
+      return self
+    self.previous_hook = self.structure.event_hook
+    self.structure.event_hook = self.on_event
+    if self.sample_every:
+      for name in TIMED_METHODS:
+        if hasattr(self.structure, name):
+          setattr(self.structure, name, self.timed(name, getattr(self.structure, name)))
+          self.timed_methods.append(name)
+    self.attached = True
+    return self
+
+  def detach(self):
+    if not self.attached:
+      return
+    self.structure.event_hook = self.previous_hook
+    for name in self.timed_methods:
+      delattr(self.structure, name)
+    self.timed_methods = []
+    self.attached = False
+
+  def on_event(self, structure, event, value):
+    operations = self.operations
+    operations[event] = operations.get(event, 0) + 1
+    if event in FIFO_ADDS or event in LIFO_ADDS or event == "insert":
+      count = value if FIFO_ADDS.get(event) or LIFO_ADDS.get(event) else 1
+      if event != "insert":
+        now = self.clock()
+        if count == 1:
+          self.arrivals.append(now)
+        else:
+          self.arrivals.extend(repeat(now, count))
+      size = len(structure)
+      if size > self.high_water:
+        self.high_water = size
+    elif event in FIFO_REMOVES:
+      self.record_dwell(value if FIFO_REMOVES[event] else 1, self.arrivals.popleft)
+    elif event in LIFO_REMOVES:
+      self.record_dwell(value if LIFO_REMOVES[event] else 1, self.arrivals.pop)
+    elif event == "full":
+      self.rejections += 1
+    elif event == "empty":
+      self.underflows += 1
+    if self.previous_hook is not None:
+      self.previous_hook(structure, event, value)
+
+  def record_dwell(self, count, take_arrival):
+    now = self.clock()
+    arrivals = self.arrivals
+    for _ in range(count):
+      if not arrivals:
+        return
+      arrived = take_arrival()
+      if arrived is not None:
+        self.dwell.record(now - arrived)
+
+  def timed(self, name, method):
+    histogram = self.latency.setdefault(name, Histogram())
+    sample_every = self.sample_every
+    clock = self.clock
+    calls = [0]
+
+    def timed_method(*args, **kwargs):
+      calls[0] += 1
+      if calls[0] % sample_every:
+        return method(*args, **kwargs)
+      start = clock()
+      try:
+        return method(*args, **kwargs)
+      finally:
+        histogram.record(clock() - start)
+    return timed_method
+
+  def snapshot(self):
+    return {
+      "structure": type(self.structure).__name__,
+      "size": len(self.structure),
+      "capacity": self.capacity,
+      "high_water": self.high_water,
+      "high_water_ratio": self.high_water / self.capacity if self.capacity else None,
+      "operations": dict(self.operations),
+      "rejections": self.rejections,
+      "underflows": self.underflows,
+      "dwell_seconds": self.dwell.snapshot(),
+      "latency_seconds": {name: histogram.snapshot() for name, histogram in self.latency.items()},
+    }
+
+  def to_json(self, **json_options):
+    return json.dumps(self.snapshot(), **json_options)
+
+def instrument(structure, sample_every=None, clock=perf_counter):
+  return Metrics(structure, sample_every, clock).attach()
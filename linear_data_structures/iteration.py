@@ -0,0 +1,47 @@
+# Walking a structure should not mean building one big string out of it.
+# Each structure defines __iter__() to hand out its values one at a time, and IterableMixin builds lazy helpers on top of that:
+# map(function), filter(predicate), take(count) and chunked(size) return a Pipeline, which is itself iterable and has the same helpers,
+# so steps can be chained, e.g. queue.filter(is_valid).map(parse).chunked(500). Nothing is computed until the pipeline is iterated.
+# write_to(fileobj) writes one value per line, like stringify_list(), but in chunks of chunk_size lines, so even a huge structure
+# is never turned into a single string.
+# As with any iterator, changing a structure while iterating over it gives undefined results.
+
+from itertools import islice
+
+class IterableMixin:
+  # No instance attributes of its own, so classes that declare __slots__ stay without a __dict__
+  __slots__ = ()
+
+  def map(self, function):
+    return Pipeline(map(function, self))
+
+  def filter(self, predicate):
+    return Pipeline(filter(predicate, self))
+
+  def take(self, count):
+    return Pipeline(islice(self, count))
+
+  def chunked(self, size):
+    return Pipeline(chunks(self, size))
+
+  def write_to(self, fileobj, chunk_size=1000):
+    for chunk in chunks(self, chunk_size):
+      fileobj.write("".join([str(value) + "\n" for value in chunk]))
+
+class Pipeline(IterableMixin):
+  __slots__ = ("iterable",)
+
+  def __init__(self, iterable):
+    self.iterable = iterable
+
+  def __iter__(self):
+    return iter(self.iterable)
+
+def chunks(iterable, size):
+  if size < 1:
+    raise ValueError("chunk size must be at least 1")
+  iterator = iter(iterable)
+  chunk = list(islice(iterator, size))
+  while chunk:
+    yield chunk
+    chunk = list(islice(iterator, size))
@@ -0,0 +1,65 @@
+# Every structure in this project (LinkedList, Queue and Stack) builds its chains out of this one Node.
+# Each node holds a value and a link to the next node in the chain.
+
+# A regular Python object carries a __dict__ so that attributes can be added at any time, and that dictionary is usually bigger than the node itself.
+# Declaring __slots__ tells Python that a Node only ever has a value and a next_node, so they are stored in two fixed slots and no __dict__ is created.
+# With tens of millions of nodes alive this saves more memory than anything else we can do to the structures.
+
+# Nodes.py calls the link link_node, so link_node, get_link_node() and set_link_node() are kept as aliases for next_node.
+
+class Node:
+  __slots__ = ("value", "next_node")
+
+  def __init__(self, value, next_node=None):
+    self.value = value
+    self.next_node = next_node
+
+  def get_value(self):
+    return self.value
+
+  def get_next_node(self):
+    return self.next_node
+
+  def set_next_node(self, next_node):
+    self.next_node = next_node
+
+  get_link_node = get_next_node
+  set_link_node = set_next_node
+  link_node = property(get_next_node, set_next_node)
+
+# Queues and stacks that churn through items create a node for every enqueue or push and throw it away on every dequeue or pop.
+# A NodePool keeps the thrown away nodes on a free list so they can be handed out again instead of allocating new ones.
+# The free list is itself a chain of nodes linked through next_node, so keeping a node in the pool costs no extra memory.
+# Released nodes have their value cleared so the pool never keeps a value alive.
+# max_size caps how many spare nodes the pool holds on to; anything released beyond that is left to the garbage collector.
+# One pool can be shared by any number of structures, as long as they are all used from the same thread.
+
+class NodePool:
+  def __init__(self, max_size=None):
+    self.free_node = None
+    self.size = 0
+    self.max_size = max_size
+    self.created = 0
+    self.reused = 0
+
+  def acquire(self, value, next_node=None):
+    node = self.free_node
+    if node is None:
+      self.created += 1
+      return Node(value, next_node)
+    self.free_node = node.next_node
+    self.size -= 1
+    self.reused += 1
+    node.value = value
+    node.next_node = next_node
+    return node
+
+  def release(self, node):
+    if self.max_size is None or self.size < self.max_size:
+      node.value = None
+      node.next_node = self.free_node
+      self.free_node = node
+      self.size += 1
+
+  def get_size(self):
+    return self.size